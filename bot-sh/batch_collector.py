@@ -2,6 +2,7 @@
 
 import argparse
 from bot_sh import cli
+from bot_sh.browser import add_profile_dir_argument
 
 
 if __name__ == "__main__":
@@ -43,6 +44,14 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable debug mode",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=3,
+        help="Number of matches scraped in parallel (default: 3)",
+    )
+
+    add_profile_dir_argument(parser)
 
     args = parser.parse_args()
 
@@ -55,4 +64,6 @@ if __name__ == "__main__":
         headless=args.headless,
         output_dir=args.output_dir,
         debug=args.debug,
+        concurrency=args.concurrency,
+        profile_dir=args.profile_dir,
     )
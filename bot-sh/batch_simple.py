@@ -2,6 +2,7 @@
 
 import argparse
 from bot_sh import cli
+from bot_sh.browser import add_profile_dir_argument
 
 
 def process_batch(
@@ -10,6 +11,7 @@ def process_batch(
     min_average: float = 1.0,
     headless: bool = False,
     debug: bool = False,
+    profile_dir: str | None = None,
 ):
     """Process multiple matches from a config file."""
     cli.run_batch_from_config(
@@ -18,6 +20,7 @@ def process_batch(
         min_average=min_average,
         headless=headless,
         debug=debug,
+        profile_dir=profile_dir,
     )
 
 
@@ -52,6 +55,8 @@ if __name__ == "__main__":
         help="Enable debug mode",
     )
 
+    add_profile_dir_argument(parser)
+
     args = parser.parse_args()
 
     stats_to_collect = cli.stats_from_args_lenient(args.stats)
@@ -62,4 +67,5 @@ if __name__ == "__main__":
         min_average=args.min_average,
         headless=args.headless,
         debug=args.debug,
+        profile_dir=args.profile_dir,
     )
@@ -0,0 +1,225 @@
+"""Playwright browser lifecycle shared by the collectors."""
+
+import argparse
+import os
+import queue
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable
+
+DEFAULT_PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "statshub", "profile")
+
+
+def add_profile_dir_argument(parser: argparse.ArgumentParser) -> None:
+    """Add ``--profile-dir [DIR]``; the bare flag means DEFAULT_PROFILE_DIR."""
+    parser.add_argument(
+        "--profile-dir",
+        dest="profile_dir",
+        nargs="?",
+        const=DEFAULT_PROFILE_DIR,
+        default=None,
+        help="Reuse a persistent browser profile (cookies, HTTP cache) across runs (default dir: ~/.cache/statshub/profile)",
+    )
+
+# /dev/shm is tiny in containers and CI; GPU compositing buys nothing here.
+_LAUNCH_ARGS = ("--disable-dev-shm-usage", "--disable-gpu")
+
+# Subresources the stats tables never need. Stylesheets stay: Playwright's
+# visibility checks and the lineup dialog scrolling depend on layout.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_URL_RE = re.compile(
+    r"googletagmanager|google-analytics|doubleclick|googlesyndication"
+    r"|hotjar|facebook\.net|clarity\.ms|adservice"
+)
+
+
+def _route_filter(route) -> None:
+    request = route.request
+    if (
+        request.resource_type in _BLOCKED_RESOURCE_TYPES
+        or _BLOCKED_URL_RE.search(request.url)
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+class BrowserSession:
+    """Own one Playwright driver and Chromium instance for a ``with`` block.
+
+    The sync Playwright API is bound to the thread that started it, so a
+    session must be created, used and closed on a single thread.
+
+    With ``user_data_dir`` the session runs one persistent context instead, so
+    cookies and the HTTP cache survive between runs; pages then share that
+    context. Chromium locks a profile, so one directory serves one session.
+    """
+
+    def __init__(
+        self,
+        headless: bool = False,
+        storage_state: dict | None = None,
+        block_resources: bool = True,
+        user_data_dir: str | None = None,
+    ) -> None:
+        self.headless = headless
+        self.storage_state = storage_state
+        self.block_resources = block_resources
+        self.user_data_dir = user_data_dir
+        self.playwright = None
+        self.browser = None
+        self.persistent_context = None
+
+    def __enter__(self) -> "BrowserSession":
+        from playwright.sync_api import sync_playwright
+
+        self.playwright = sync_playwright().start()
+        try:
+            if self.user_data_dir:
+                os.makedirs(self.user_data_dir, exist_ok=True)
+                self.persistent_context = (
+                    self.playwright.chromium.launch_persistent_context(
+                        self.user_data_dir,
+                        headless=self.headless,
+                        args=list(_LAUNCH_ARGS),
+                    )
+                )
+                if self.block_resources:
+                    self.persistent_context.route("**/*", _route_filter)
+            else:
+                self.browser = self.playwright.chromium.launch(
+                    headless=self.headless, args=list(_LAUNCH_ARGS)
+                )
+        except Exception:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.persistent_context is not None:
+            try:
+                self.persistent_context.close()
+            except Exception:
+                pass
+            self.persistent_context = None
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+        if self.playwright is not None:
+            self.playwright.stop()
+            self.playwright = None
+
+    def new_context(self):
+        if self.persistent_context is not None:
+            return self.persistent_context
+        if self.storage_state is not None:
+            context = self.browser.new_context(storage_state=self.storage_state)
+        else:
+            context = self.browser.new_context()
+        if self.block_resources:
+            context.route("**/*", _route_filter)
+        return context
+
+    def remember_storage_state(self, page) -> dict:
+        """Keep the cookies/localStorage of ``page`` for later contexts.
+
+        Only the first call snapshots; StatsHub state (consent, etc.) does not
+        change between matches, so new contexts start from it instead of
+        re-establishing it on every navigation.
+        """
+        if self.storage_state is None:
+            self.storage_state = page.context.storage_state()
+        return self.storage_state
+
+    @contextmanager
+    def page(self):
+        """Yield a page in a fresh context; the context is closed afterwards.
+
+        In persistent mode only the page is closed.
+        """
+        if self.persistent_context is not None:
+            page = self.persistent_context.new_page()
+            try:
+                yield page
+            finally:
+                page.close()
+            return
+        context = self.new_context()
+        try:
+            yield context.new_page()
+        finally:
+            context.close()
+
+
+def map_with_sessions(
+    fn: Callable[["BrowserSession", int], Any],
+    count: int,
+    workers: int,
+    headless: bool = False,
+    stagger_s: float = 0.5,
+    user_data_dir: str | None = None,
+) -> list:
+    """Run ``fn(session, index)`` for ``range(count)`` on a pool of browsers.
+
+    Each worker thread owns one BrowserSession and pulls the next index from a
+    shared queue, so a slow match never holds up the others. Worker starts are
+    staggered by ``stagger_s`` to avoid a burst of page loads on the same site.
+    Results are returned in index order. With ``user_data_dir`` each worker
+    gets its own ``worker-N`` profile below it.
+
+    A failure never aborts the batch: an index whose ``fn`` raised holds that
+    exception, and indices no worker could reach (every browser failed to
+    launch) hold the launch error.
+    """
+    if count <= 0:
+        return []
+    jobs: queue.SimpleQueue[int] = queue.SimpleQueue()
+    for index in range(count):
+        jobs.put(index)
+    pending = object()
+    results: list[Any] = [pending] * count
+    launch_errors: list[Exception] = []
+
+    def _worker(worker_index: int) -> None:
+        if worker_index:
+            time.sleep(worker_index * stagger_s)
+            if jobs.empty():
+                return
+        profile = None
+        if user_data_dir:
+            profile = os.path.join(user_data_dir, f"worker-{worker_index}")
+        try:
+            session = BrowserSession(headless=headless, user_data_dir=profile)
+            session.__enter__()
+        except Exception as e:
+            # Leave the queue to workers whose browser did start.
+            launch_errors.append(e)
+            return
+        try:
+            while True:
+                try:
+                    index = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results[index] = fn(session, index)
+                except Exception as e:
+                    results[index] = e
+        finally:
+            session.close()
+
+    workers = max(1, min(workers, count))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(_worker, w) for w in range(workers)]:
+            future.result()
+    if launch_errors:
+        results = [launch_errors[-1] if r is pending else r for r in results]
+    return results
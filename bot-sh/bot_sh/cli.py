@@ -1,23 +1,44 @@
 import argparse
-import json
+import functools
 import os
+import re
+import sys
+from contextlib import nullcontext
 from typing import Any
 
 from . import scraper
+from .browser import BrowserSession, add_profile_dir_argument, map_with_sessions
 from .models import (
-    CLI_STAT_MAPPING,
+    CANONICAL_STAT_MAPPING,
     DEFAULT_AWAY_TEAM,
     DEFAULT_HOME_TEAM,
     DEFAULT_MATCH_NAME,
     DEFAULT_STATS,
+    POSITION_INDEX,
     STAT_DISPLAY_NAMES,
+    normalize_team_names,
 )
-from .outputs import derive_alt_output_path, save_results
+from .outputs import derive_alt_output_path, loads_json, save_results
 
 ANSI_RESET = "\033[0m"
 ANSI_GREEN = "\033[32m"
 ANSI_RED = "\033[31m"
 
+_TEAM_SUFFIX_RE = re.compile(r"\s+(Deportivo|Real Sociedad)$")
+_STAT_TOKEN_RE = re.compile(r"[^,\s]+")
+_SUMMARY_ROW_FORMAT = "   {pos:<12} {total:<15} {color}{avg:<10}{reset} {high:<10}"
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(path: str, mtime_ns: int) -> dict:
+    """Parse a JSON file; ``mtime_ns`` is only part of the cache key."""
+    with open(path, "rb") as f:
+        return loads_json(f.read())
+
+
+def _load_json(path: str) -> dict:
+    return _load_json_cached(path, os.stat(path).st_mtime_ns)
+
 
 def parse_args(argv: list[str] | None = None):
     p = argparse.ArgumentParser(description="StatsHub position stats collector")
@@ -95,11 +116,18 @@ def parse_args(argv: list[str] | None = None):
         default=DEFAULT_AWAY_TEAM,
         help=f"Away team tab name (e.g., '{DEFAULT_AWAY_TEAM}'). Default: '{DEFAULT_AWAY_TEAM}'",
     )
+    add_profile_dir_argument(p)
+    p.add_argument(
+        "--parallel-teams",
+        dest="parallel_teams",
+        action="store_true",
+        help="Collect both team tabs at the same time, one browser each (quieter output).",
+    )
     return p.parse_args(argv)
 
 
 def _parse_stats(stats_value: str) -> list[str]:
-    return [s.strip().lower() for s in stats_value.split(",") if s.strip()]
+    return _STAT_TOKEN_RE.findall(stats_value.lower().replace("_", "-"))
 
 
 def stats_from_args_strict(stats_value: str, all_stats: bool) -> list[str] | None:
@@ -111,8 +139,9 @@ def stats_from_args_strict(stats_value: str, all_stats: bool) -> list[str] | Non
 
     stats_to_collect = []
     for stat_name in requested_stats:
-        if stat_name in CLI_STAT_MAPPING:
-            stats_to_collect.append(CLI_STAT_MAPPING[stat_name])
+        internal = CANONICAL_STAT_MAPPING.get(stat_name)
+        if internal is not None:
+            stats_to_collect.append(internal)
         else:
             print(
                 "⚠️ Unknown stat: '{}'.".format(stat_name)
@@ -127,10 +156,11 @@ def stats_from_args_strict(stats_value: str, all_stats: bool) -> list[str] | Non
 
 def stats_from_args_lenient(stats_value: str) -> list[str] | None:
     requested_stats = _parse_stats(stats_value)
-    stats_to_collect = []
-    for stat_name in requested_stats:
-        if stat_name in CLI_STAT_MAPPING:
-            stats_to_collect.append(CLI_STAT_MAPPING[stat_name])
+    stats_to_collect = [
+        CANONICAL_STAT_MAPPING[stat_name]
+        for stat_name in requested_stats
+        if stat_name in CANONICAL_STAT_MAPPING
+    ]
     return stats_to_collect if stats_to_collect else None
 
 
@@ -138,6 +168,10 @@ def _stat_display_name(stat_type: str) -> str:
     return STAT_DISPLAY_NAMES.get(stat_type, stat_type)
 
 
+def _strip_team_suffix(team_name: str) -> str:
+    return _TEAM_SUFFIX_RE.sub("", team_name)
+
+
 def _swap_to_opponent_team_view(
     all_collected_data: dict,
     home_team_display: str,
@@ -145,10 +179,11 @@ def _swap_to_opponent_team_view(
 ) -> dict:
     if home_team_display not in all_collected_data or away_team_display not in all_collected_data:
         return all_collected_data
-    return {
-        home_team_display: all_collected_data.get(away_team_display, {}),
-        away_team_display: all_collected_data.get(home_team_display, {}),
-    }
+    all_collected_data[home_team_display], all_collected_data[away_team_display] = (
+        all_collected_data[away_team_display],
+        all_collected_data[home_team_display],
+    )
+    return all_collected_data
 
 
 def run_single(
@@ -163,140 +198,283 @@ def run_single(
     home_team_name: str = DEFAULT_HOME_TEAM,
     away_team_name: str = DEFAULT_AWAY_TEAM,
     verbose: bool = True,
+    profile_dir: str | None = None,
+    parallel_teams: bool = False,
 ) -> None:
-    from playwright.sync_api import sync_playwright
+    if verbose:
+        print("🚀 Starting StatsHub Flow Replication...\n")
+
+    if parallel_teams:
+        # One browser per team tab, each in its own thread (the sync API is
+        # thread-bound); the step-by-step logs and spinners are skipped.
+        _run_single_parallel_teams(
+            min_average=min_average,
+            debug=debug,
+            stats=stats,
+            headless=headless,
+            output=output,
+            output_both=output_both,
+            date_filter=date_filter,
+            match_name=match_name,
+            home_team_name=home_team_name,
+            away_team_name=away_team_name,
+            verbose=verbose,
+            profile_dir=profile_dir,
+        )
+        return
+
+    with BrowserSession(
+        headless=headless, user_data_dir=profile_dir
+    ) as session, session.page() as page:
+        _run_single_on_page(
+            page,
+            min_average=min_average,
+            debug=debug,
+            stats=stats,
+            output=output,
+            output_both=output_both,
+            date_filter=date_filter,
+            match_name=match_name,
+            home_team_name=home_team_name,
+            away_team_name=away_team_name,
+            verbose=verbose,
+        )
 
-    with sync_playwright() as playwright:
-        if verbose:
-            print("🚀 Starting StatsHub Flow Replication...\n")
 
-        if stats is None:
-            stats = DEFAULT_STATS
+def _run_single_on_page(
+    page,
+    min_average: float,
+    debug: bool,
+    stats: list | None,
+    output: str | None,
+    output_both: bool,
+    date_filter: str,
+    match_name: str,
+    home_team_name: str,
+    away_team_name: str,
+    verbose: bool,
+) -> None:
+    if stats is None:
+        stats = DEFAULT_STATS
+
+    all_collected_data = {}
+    home_team_display = _strip_team_suffix(home_team_name)
+    away_team_display = _strip_team_suffix(away_team_name)
 
-        browser = playwright.chromium.launch(headless=headless)
-        context = browser.new_context()
-        page = context.new_page()
-        all_collected_data = {}
+    try:
+        scraper.navigate_to_match(
+            page,
+            date_filter=date_filter,
+            match_name=match_name,
+            verbose=verbose,
+        )
 
-        try:
-            scraper.navigate_to_match(
+        for stat_type in stats:
+            stat_display = _stat_display_name(stat_type)
+
+            if verbose:
+                print(f"\n{'='*60}")
+                print(f"📊 Collecting {stat_display} stats")
+                print(f"{'='*60}\n")
+
+            scraper.select_team_and_stat(
                 page,
-                date_filter=date_filter,
-                match_name=match_name,
+                home_team_name,
+                stat_type,
+                stat_display,
                 verbose=verbose,
             )
 
-            for stat_type in stats:
-                stat_display = _stat_display_name(stat_type)
-
-                if verbose:
-                    print(f"\n{'='*60}")
-                    print(f"📊 Collecting {stat_display} stats")
-                    print(f"{'='*60}\n")
-
-                scraper.select_team_and_stat(
+            if verbose:
+                print(
+                    f"📏  Collecting {stat_display} for {home_team_display}...\n"
+                )
+            if home_team_display not in all_collected_data:
+                all_collected_data[home_team_display] = {}
+            all_collected_data[home_team_display][stat_display] = (
+                scraper.collect_stats_for_all_positions(
                     page,
-                    home_team_name,
+                    home_team_display,
                     stat_type,
-                    stat_display,
+                    debug=debug,
+                    show_spinner=not debug,
                     verbose=verbose,
                 )
+            )
+
+            if verbose:
+                print(f"\n📍 Step 9: Switching to opponent team...")
+            scraper.switch_team_tab(page, away_team_name)
 
-                home_team_display = home_team_name.replace(" Deportivo", "").replace(
-                    " Real Sociedad", ""
+            if verbose:
+                print(
+                    f"📍 Step 10: Selecting stat {stat_display} for opponent team..."
                 )
-                away_team_display = away_team_name.replace(" Deportivo", "").replace(
-                    " Real Sociedad", ""
+            scraper.select_stat(page, stat_type)
+
+            if verbose:
+                print(
+                    f"\n🏟️  Collecting {stat_display} for {away_team_display}...\n"
                 )
-                if verbose:
-                    print(
-                        f"📏  Collecting {stat_display} for {home_team_display}...\n"
-                    )
-                if home_team_display not in all_collected_data:
-                    all_collected_data[home_team_display] = {}
-                all_collected_data[home_team_display][stat_display] = (
-                    scraper.collect_stats_for_all_positions(
-                        page,
-                        home_team_display,
-                        stat_type,
-                        debug=debug,
-                        show_spinner=not debug,
-                        verbose=verbose,
-                    )
+            if away_team_display not in all_collected_data:
+                all_collected_data[away_team_display] = {}
+            all_collected_data[away_team_display][stat_display] = (
+                scraper.collect_stats_for_all_positions(
+                    page,
+                    away_team_display,
+                    stat_type,
+                    debug=debug,
+                    show_spinner=not debug,
+                    verbose=verbose,
                 )
+            )
 
-                if verbose:
-                    print(f"\n📍 Step 9: Switching to opponent team...")
-                page.get_by_role("tab", name=away_team_name).click()
-                page.wait_for_load_state("networkidle")
-                try:
-                    page.get_by_label("Stat").wait_for(timeout=5000)
-                except Exception:
-                    page.wait_for_timeout(1000)
-
+            if stat_type != stats[-1]:
                 if verbose:
                     print(
-                        f"📍 Step 10: Selecting stat {stat_display} for opponent team..."
+                        f"\n📍 Switching back to {home_team_display} for next stat..."
                     )
-                page.get_by_label("Stat").select_option(stat_type)
+                scraper.switch_team_tab(page, home_team_name)
+
+        _finish_single(
+            all_collected_data,
+            home_team_display,
+            away_team_display,
+            min_average=min_average,
+            output=output,
+            output_both=output_both,
+            verbose=verbose,
+        )
 
-                if verbose:
-                    print(
-                        f"\n🏟️  Collecting {stat_display} for {away_team_display}...\n"
-                    )
-                if away_team_display not in all_collected_data:
-                    all_collected_data[away_team_display] = {}
-                all_collected_data[away_team_display][stat_display] = (
-                    scraper.collect_stats_for_all_positions(
-                        page,
-                        away_team_display,
-                        stat_type,
-                        debug=debug,
-                        show_spinner=not debug,
-                        verbose=verbose,
-                    )
-                )
+    except Exception as e:
+        print(f"\n❌ Error during flow execution: {str(e)}")
+        raise
 
-                if stat_type != stats[-1]:
-                    if verbose:
-                        print(
-                            f"\n📍 Switching back to {home_team_display} for next stat..."
-                        )
-                    page.get_by_role("tab", name=home_team_name).click()
-                    page.wait_for_load_state("networkidle")
-                    try:
-                        page.get_by_label("Stat").wait_for(timeout=5000)
-                    except Exception:
-                        page.wait_for_timeout(1000)
-
-            all_collected_data = _swap_to_opponent_team_view(
-                all_collected_data,
-                home_team_display,
-                away_team_display,
-            )
-            _print_summary(all_collected_data, min_average)
 
-            if verbose:
-                print("\n✅ Flow replication completed successfully!")
+def _finish_single(
+    all_collected_data: dict,
+    home_team_display: str,
+    away_team_display: str,
+    min_average: float,
+    output: str | None,
+    output_both: bool,
+    verbose: bool,
+) -> None:
+    all_collected_data = _swap_to_opponent_team_view(
+        all_collected_data,
+        home_team_display,
+        away_team_display,
+    )
+    _print_summary(all_collected_data, min_average)
 
-            if output or output_both:
-                if not output and output_both:
-                    save_results(all_collected_data, "out.json")
-                    save_results(all_collected_data, "out.csv")
-                else:
-                    if output:
-                        save_results(all_collected_data, output)
-                    if output_both:
-                        alt = derive_alt_output_path(output)
-                        save_results(all_collected_data, alt)
+    if verbose:
+        print("\n✅ Flow replication completed successfully!")
+
+    if output or output_both:
+        if not output and output_both:
+            save_results(all_collected_data, "out.json")
+            save_results(all_collected_data, "out.csv")
+        else:
+            if output:
+                save_results(all_collected_data, output)
+            if output_both:
+                alt = derive_alt_output_path(output)
+                save_results(all_collected_data, alt)
 
-        except Exception as e:
-            print(f"\n❌ Error during flow execution: {str(e)}")
-            raise
 
-        finally:
-            context.close()
-            browser.close()
+def _collect_team_on_page(
+    page,
+    team_name: str,
+    team_display: str,
+    stats: list,
+    debug: bool,
+    date_filter: str,
+    match_name: str,
+) -> dict:
+    """Open the match on ``page`` and collect every stat for one team tab."""
+    scraper.navigate_to_match(
+        page, date_filter=date_filter, match_name=match_name, verbose=False
+    )
+    team_data = {}
+    for stat_type in stats:
+        stat_display = _stat_display_name(stat_type)
+        scraper.select_team_and_stat(
+            page, team_name, stat_type, stat_display, verbose=False
+        )
+        team_data[stat_display] = scraper.collect_stats_for_all_positions(
+            page,
+            team_display,
+            stat_type,
+            debug=debug,
+            show_spinner=False,
+            verbose=False,
+        )
+    return team_data
+
+
+def _run_single_parallel_teams(
+    min_average: float,
+    debug: bool,
+    stats: list | None,
+    headless: bool,
+    output: str | None,
+    output_both: bool,
+    date_filter: str,
+    match_name: str,
+    home_team_name: str,
+    away_team_name: str,
+    verbose: bool,
+    profile_dir: str | None,
+) -> None:
+    if stats is None:
+        stats = DEFAULT_STATS
+    home_team_display = _strip_team_suffix(home_team_name)
+    away_team_display = _strip_team_suffix(away_team_name)
+    teams = (
+        (home_team_name, home_team_display),
+        (away_team_name, away_team_display),
+    )
+
+    def _collect(session: BrowserSession, index: int) -> dict:
+        team_name, team_display = teams[index]
+        if verbose:
+            print(f"📊 Collecting {team_display}...")
+        with session.page() as page:
+            return _collect_team_on_page(
+                page,
+                team_name,
+                team_display,
+                stats,
+                debug=debug,
+                date_filter=date_filter,
+                match_name=match_name,
+            )
+
+    try:
+        home_data, away_data = map_with_sessions(
+            _collect,
+            len(teams),
+            workers=len(teams),
+            headless=headless,
+            stagger_s=0.0,
+            user_data_dir=profile_dir,
+        )
+        for team_data in (home_data, away_data):
+            if isinstance(team_data, Exception):
+                raise team_data
+    except Exception as e:
+        print(f"\n❌ Error during flow execution: {str(e)}")
+        raise
+
+    _finish_single(
+        {home_team_display: home_data, away_team_display: away_data},
+        home_team_display,
+        away_team_display,
+        min_average=min_average,
+        output=output,
+        output_both=output_both,
+        verbose=verbose,
+    )
 
 
 def run_single_by_url(
@@ -309,72 +487,74 @@ def run_single_by_url(
     headless: bool = False,
     output: str | None = None,
     output_both: bool = False,
-    home_lineup_positions: list[str] | None = None,
-    away_lineup_positions: list[str] | None = None,
+    home_lineup_positions: tuple[str, ...] | None = None,
+    away_lineup_positions: tuple[str, ...] | None = None,
     verbose: bool = True,
-) -> None:
-    from playwright.sync_api import sync_playwright
-
-    with sync_playwright() as playwright:
-        if verbose:
-            print("🚀 Starting StatsHub Flow Replication...\n")
-
-        browser = playwright.chromium.launch(headless=headless)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            all_collected_data = _collect_match_stats(
-                page,
-                match_url=match_url,
-                home_team_tab=home_team_tab,
-                away_team_tab=away_team_tab,
-                stats=stats,
-                min_average=min_average,
-                debug=debug,
-                verbose=verbose,
-            )
-
-            if not all_collected_data:
-                print("❌ No data collected.")
-                return
-
-            home_team_display = home_team_tab.title()
-            away_team_display = away_team_tab.title()
-            all_collected_data = _swap_to_opponent_team_view(
-                all_collected_data,
-                home_team_display,
-                away_team_display,
-            )
-            summary_filters = None
-            if home_lineup_positions or away_lineup_positions:
-                summary_filters = {
-                    home_team_display: set(away_lineup_positions or []),
-                    away_team_display: set(home_lineup_positions or []),
-                }
-            _print_summary(
-                all_collected_data,
-                min_average,
-                allowed_positions_by_team=summary_filters,
-                colorize_threshold=bool(summary_filters),
-            )
-            if verbose:
-                print("\n✅ Flow replication completed successfully!")
+    session: BrowserSession | None = None,
+) -> dict | None:
+    """Scrape one match by URL; pass ``session`` to reuse an open browser.
+
+    Returns the collected data (``None`` if nothing was collected) so callers
+    can use it without re-reading ``output``.
+    """
+    if verbose:
+        print("🚀 Starting StatsHub Flow Replication...\n")
+
+    owner = (
+        nullcontext(session)
+        if session is not None
+        else BrowserSession(headless=headless)
+    )
+    with owner as session, session.page() as page:
+        all_collected_data = _collect_match_stats(
+            page,
+            match_url=match_url,
+            home_team_tab=home_team_tab,
+            away_team_tab=away_team_tab,
+            stats=stats,
+            min_average=min_average,
+            debug=debug,
+            verbose=verbose,
+        )
 
-            if output or output_both:
-                if not output and output_both:
-                    save_results(all_collected_data, "out.json")
-                    save_results(all_collected_data, "out.csv")
-                else:
-                    if output:
-                        save_results(all_collected_data, output)
-                    if output_both:
-                        alt = derive_alt_output_path(output)
-                        save_results(all_collected_data, alt)
+        if not all_collected_data:
+            print("❌ No data collected.")
+            return None
 
-        finally:
-            context.close()
-            browser.close()
+        home_team_display, away_team_display, _ = normalize_team_names(
+            home_team_tab, away_team_tab
+        )
+        all_collected_data = _swap_to_opponent_team_view(
+            all_collected_data,
+            home_team_display,
+            away_team_display,
+        )
+        summary_filters = None
+        if home_lineup_positions or away_lineup_positions:
+            summary_filters = {
+                home_team_display: frozenset(away_lineup_positions or ()),
+                away_team_display: frozenset(home_lineup_positions or ()),
+            }
+        _print_summary(
+            all_collected_data,
+            min_average,
+            allowed_positions_by_team=summary_filters,
+            colorize_threshold=bool(summary_filters),
+        )
+        if verbose:
+            print("\n✅ Flow replication completed successfully!")
+
+        if output or output_both:
+            if not output and output_both:
+                save_results(all_collected_data, "out.json")
+                save_results(all_collected_data, "out.csv")
+            else:
+                if output:
+                    save_results(all_collected_data, output)
+                if output_both:
+                    alt = derive_alt_output_path(output)
+                    save_results(all_collected_data, alt)
+        return all_collected_data
 
 
 def run_batch_from_team_tabs(
@@ -384,73 +564,98 @@ def run_batch_from_team_tabs(
     headless: bool = False,
     output_dir: str | None = None,
     debug: bool = False,
+    concurrency: int = 1,
+    profile_dir: str | None = None,
 ) -> None:
-    from playwright.sync_api import sync_playwright
-
     if not os.path.exists(team_tabs_path):
         raise FileNotFoundError(
             f"Missing {team_tabs_path}. Generate it with bot-sh/extract_team_names.py."
         )
 
-    with open(team_tabs_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json(team_tabs_path)
     matches = data.get("matches", [])
+    total = len(matches)
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=headless)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            all_results = {}
-            success_count = 0
+    # Each worker owns its own BrowserSession: the sync API is bound to the
+    # thread that started it. Matches get a fresh context each.
+    sequential = min(concurrency, total) <= 1
+    # Storage state captured by whichever worker finishes a match first.
+    shared_state: dict[str, Any] = {}
 
-            for i, match in enumerate(matches, 1):
-                home = match.get("home_team_tab")
-                away = match.get("away_team_tab")
-                match_url = match.get("match_url")
+    def _process_match(session: BrowserSession, index: int) -> tuple[str, str]:
+        match = matches[index]
+        home = match.get("home_team_tab")
+        away = match.get("away_team_tab")
+        match_url = match.get("match_url")
 
-                print(f"\n[{i}/{len(matches)}] Processing: {home} vs {away}")
-                print("-" * 80)
+        print(f"\n[{index + 1}/{total}] Processing: {home} vs {away}")
+        if sequential:
+            print("-" * 80)
 
-                match_key = f"{home} vs {away}"
-                output_file = None
-                if output_dir:
-                    output_file = f"{output_dir}/{match_key.replace(' ', '_').lower()}.json"
+        match_key = f"{home} vs {away}"
+        if session.storage_state is None:
+            session.storage_state = shared_state.get("storage_state")
 
-                try:
-                    result = _collect_match_stats(
-                        page,
-                        match_url=match_url,
-                        home_team_tab=home,
-                        away_team_tab=away,
-                        stats=stats,
-                        min_average=min_average,
-                        debug=debug,
+        try:
+            output_file = None
+            if output_dir:
+                output_file = f"{output_dir}/{normalize_team_names(home, away)[2]}.json"
+            with session.page() as page:
+                result = _collect_match_stats(
+                    page,
+                    match_url=match_url,
+                    home_team_tab=home,
+                    away_team_tab=away,
+                    stats=stats,
+                    min_average=min_average,
+                    debug=debug,
+                    verbose=sequential,
+                    show_spinner=sequential,
+                )
+                if result:
+                    shared_state.setdefault(
+                        "storage_state", session.remember_storage_state(page)
                     )
 
-                    if result:
-                        if output_file:
-                            save_results(result, output_file)
-                        all_results[match_key] = "✅ Success"
-                        success_count += 1
-                    else:
-                        all_results[match_key] = "❌ No data collected"
-
-                except Exception as e:
-                    print(f"  ❌ Error: {e}")
-                    all_results[match_key] = f"❌ {str(e)[:50]}"
+            if result:
+                if output_file:
+                    save_results(result, output_file)
+                return match_key, "✅ Success"
+            return match_key, "❌ No data collected"
 
-            print("\n" + "=" * 80)
-            print("📋 BATCH SUMMARY")
-            print("=" * 80)
-            for match, status in all_results.items():
-                print(f"  {match}: {status}")
-            print(f"\n✅ Successfully processed: {success_count}/{len(matches)}")
+        except Exception as e:
+            print(f"  ❌ Error ({match_key}): {e}")
+            return match_key, f"❌ {str(e)[:50]}"
+
+    statuses = map_with_sessions(
+        _process_match,
+        total,
+        workers=concurrency,
+        headless=headless,
+        user_data_dir=profile_dir,
+    )
+    # A browser that never launched leaves its matches holding the error.
+    statuses = [
+        (
+            f"{matches[i].get('home_team_tab')} vs {matches[i].get('away_team_tab')}",
+            f"❌ {str(s)[:50]}",
+        )
+        if isinstance(s, Exception)
+        else s
+        for i, s in enumerate(statuses)
+    ]
+
+    all_results = dict(s for s in statuses if s is not None)
+    success_count = sum(
+        1 for s in statuses if s is not None and s[1] == "✅ Success"
+    )
 
-        finally:
-            context.close()
-            browser.close()
+    print("\n" + "=" * 80)
+    print("📋 BATCH SUMMARY")
+    print("=" * 80)
+    for match, status in all_results.items():
+        print(f"  {match}: {status}")
+    print(f"\n✅ Successfully processed: {success_count}/{total}")
 
 
 def _collect_match_stats(
@@ -462,6 +667,7 @@ def _collect_match_stats(
     min_average: float,
     debug: bool,
     verbose: bool,
+    show_spinner: bool = True,
 ):
     if stats is None:
         stats = DEFAULT_STATS
@@ -469,8 +675,9 @@ def _collect_match_stats(
     all_collected_data = {}
 
     scraper.navigate_to_match_by_url(page, match_url, verbose=verbose)
-    home_team_display = home_team_tab.title()
-    away_team_display = away_team_tab.title()
+    home_team_display, away_team_display, _ = normalize_team_names(
+        home_team_tab, away_team_tab
+    )
 
     for stat_type in stats:
         stat_display = _stat_display_name(stat_type)
@@ -490,7 +697,7 @@ def _collect_match_stats(
                 home_team_display,
                 stat_type,
                 debug=debug,
-                show_spinner=not debug,
+                show_spinner=show_spinner and not debug,
                 verbose=verbose,
             )
         )
@@ -498,14 +705,9 @@ def _collect_match_stats(
         if verbose:
             print(f"  ✓ Collected for {home_team_display}")
 
-        page.get_by_role("tab", name=away_team_tab).click()
-        page.wait_for_load_state("networkidle")
-        try:
-            page.get_by_label("Stat").wait_for(timeout=5000)
-        except Exception:
-            page.wait_for_timeout(1000)
+        scraper.switch_team_tab(page, away_team_tab)
 
-        page.get_by_label("Stat").select_option(stat_type)
+        scraper.select_stat(page, stat_type)
 
         if away_team_display not in all_collected_data:
             all_collected_data[away_team_display] = {}
@@ -515,7 +717,7 @@ def _collect_match_stats(
                 away_team_display,
                 stat_type,
                 debug=debug,
-                show_spinner=not debug,
+                show_spinner=show_spinner and not debug,
                 verbose=verbose,
             )
         )
@@ -524,115 +726,102 @@ def _collect_match_stats(
             print(f"  ✓ Collected for {away_team_display}")
 
         if stat_type != stats[-1]:
-            page.get_by_role("tab", name=home_team_tab).click()
-            page.wait_for_load_state("networkidle")
-            try:
-                page.get_by_label("Stat").wait_for(timeout=5000)
-            except Exception:
-                page.wait_for_timeout(1000)
+            scraper.switch_team_tab(page, home_team_tab)
 
     return all_collected_data
 
 
 def _to_float_or_zero(value: Any) -> float:
+    if value is None or value == "":
+        return 0.0
     try:
-        if value is None or value == "":
-            return 0.0
         return float(value)
-    except Exception:
+    except (TypeError, ValueError):
         return 0.0
 
 
+def _format_number(value: float) -> str:
+    return str(int(value)) if value.is_integer() else f"{value:.2f}"
+
+
 def _print_summary(
     all_collected_data: dict,
     min_average: float,
-    allowed_positions_by_team: dict[str, set[str]] | None = None,
+    allowed_positions_by_team: dict[str, frozenset[str]] | None = None,
     colorize_threshold: bool = False,
 ) -> None:
-    print("\n" + "=" * 80)
+    threshold = float(min_average)
+    row_format = _SUMMARY_ROW_FORMAT.format
+    reset = ANSI_RESET if colorize_threshold else ""
+    # Built up line by line and written once, rather than one print per row.
+    buf: list[str] = ["", "=" * 80]
     if colorize_threshold:
-        print(
+        buf.append(
             "📊 COLLECTED STATS SUMMARY (confirmed lineups only; min-average color threshold = {})".format(
                 min_average
             )
         )
     else:
-        print(
+        buf.append(
             "📊 COLLECTED STATS SUMMARY (filtered by min-average >= {})".format(
                 min_average
             )
         )
-    print("=" * 80)
+    buf.append("=" * 80)
     for team, stats_dict in all_collected_data.items():
-        print(f"\n🏟️  {team}:")
+        buf.append(f"\n🏟️  {team}:")
         allowed_positions = None
         if allowed_positions_by_team:
             allowed_positions = allowed_positions_by_team.get(team)
         for stat_name, stat_positions in stats_dict.items():
-            print(f"\n   📈 {stat_name}:")
+            buf.append(f"\n   📈 {stat_name}:")
+            # (position, total, average, highest) tuples, coerced once.
             filtered = []
             for pos in stat_positions:
                 position_name = pos.get("position", "")
                 if allowed_positions is not None and position_name not in allowed_positions:
                     continue
-
-                total_val = _to_float_or_zero(pos.get("total"))
                 avg_val = _to_float_or_zero(pos.get("average"))
-                high_val = _to_float_or_zero(pos.get("highest"))
-                normalized = {
-                    "position": position_name,
-                    "total": total_val,
-                    "average": avg_val,
-                    "highest": high_val,
-                }
-                if colorize_threshold:
-                    filtered.append(normalized)
-                elif avg_val >= float(min_average):
-                    filtered.append(normalized)
-
+                if colorize_threshold or avg_val >= threshold:
+                    filtered.append(
+                        (
+                            position_name,
+                            _to_float_or_zero(pos.get("total")),
+                            avg_val,
+                            _to_float_or_zero(pos.get("highest")),
+                        )
+                    )
+            # Highest average first; ties fall back to canonical position order.
             filtered.sort(
-                key=lambda p: p.get("average", 0.0),
-                reverse=True,
+                key=lambda row: (-row[2], POSITION_INDEX.get(row[0], len(POSITION_INDEX)))
             )
 
             if not filtered:
                 if colorize_threshold and allowed_positions is not None:
-                    print("   No positions from confirmed lineup.")
+                    buf.append("   No positions from confirmed lineup.")
                 else:
-                    print(f"   No positions with average >= {min_average}.")
+                    buf.append(f"   No positions with average >= {min_average}.")
                 continue
 
-            print(
+            buf.append(
                 f"   {'Position':<12} {'Total':<15} {'Average':<10} {'Highest':<10}"
             )
-            print("   " + "-" * 50)
-            for pos in filtered:
-                total_display = (
-                    str(int(pos["total"])) if pos["total"].is_integer() else f"{pos['total']:.2f}"
-                )
-                avg_display = (
-                    str(int(pos["average"]))
-                    if pos["average"].is_integer()
-                    else f"{pos['average']:.2f}"
-                )
-                high_display = (
-                    str(int(pos["highest"]))
-                    if pos["highest"].is_integer()
-                    else f"{pos['highest']:.2f}"
-                )
-
+            buf.append("   " + "-" * 50)
+            for position_name, total_val, avg_val, high_val in filtered:
+                color = ""
                 if colorize_threshold:
-                    color = (
-                        ANSI_GREEN
-                        if pos["average"] >= float(min_average)
-                        else ANSI_RED
+                    color = ANSI_GREEN if avg_val >= threshold else ANSI_RED
+                buf.append(
+                    row_format(
+                        pos=position_name,
+                        total=_format_number(total_val),
+                        color=color,
+                        avg=_format_number(avg_val),
+                        reset=reset,
+                        high=_format_number(high_val),
                     )
-                    avg_cell = f"{color}{avg_display:<10}{ANSI_RESET}"
-                else:
-                    avg_cell = f"{avg_display:<10}"
-                print(
-                    f"   {pos['position']:<12} {total_display:<15} {avg_cell} {high_display:<10}"
                 )
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
 def run_batch_from_config(
@@ -641,44 +830,45 @@ def run_batch_from_config(
     min_average: float = 1.0,
     headless: bool = False,
     debug: bool = False,
+    profile_dir: str | None = None,
 ) -> None:
-    with open(config_file, "r") as f:
-        config = json.load(f)
+    config = _load_json(config_file)
 
     matches = config.get("matches", [])
     print(f"\n📊 Processing {len(matches)} matches from {config_file}\n")
 
     results = {}
-    for i, match in enumerate(matches, 1):
-        match_key = f"{match['home_team']} vs {match['away_team']}"
-        print(f"\n[{i}/{len(matches)}] {match_key}")
-        print("-" * 80)
+    # One browser for the whole batch; each match only gets a fresh context.
+    with BrowserSession(headless=headless, user_data_dir=profile_dir) as session:
+        for i, match in enumerate(matches, 1):
+            match_key = f"{match['home_team']} vs {match['away_team']}"
+            print(f"\n[{i}/{len(matches)}] {match_key}")
+            print("-" * 80)
 
-        try:
-            output_file = (
-                "results/"
-                + match["home_team"].replace(" ", "_").lower()
-                + "_vs_"
-                + match["away_team"].replace(" ", "_").lower()
-                + ".json"
-            )
+            try:
+                slug = normalize_team_names(match["home_team"], match["away_team"])[2]
+                output_file = f"results/{slug}.json"
 
-            run_single(
-                min_average=min_average,
-                debug=debug,
-                stats=stats,
-                headless=headless,
-                output=output_file,
-                output_both=False,
-                date_filter="today",
-                match_name=match.get("match_name", match["home_team"]),
-                home_team_name=match["home_team"],
-                away_team_name=match["away_team"],
-            )
-            results[match_key] = "✅ Success"
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            results[match_key] = f"❌ {str(e)[:50]}"
+                print("🚀 Starting StatsHub Flow Replication...\n")
+                with session.page() as page:
+                    _run_single_on_page(
+                        page,
+                        min_average=min_average,
+                        debug=debug,
+                        stats=stats,
+                        output=output_file,
+                        output_both=False,
+                        date_filter="today",
+                        match_name=match.get("match_name", match["home_team"]),
+                        home_team_name=match["home_team"],
+                        away_team_name=match["away_team"],
+                        verbose=True,
+                    )
+                    session.remember_storage_state(page)
+                results[match_key] = "✅ Success"
+            except Exception as e:
+                print(f"❌ Error: {e}")
+                results[match_key] = f"❌ {str(e)[:50]}"
 
     print("\n" + "=" * 80)
     print("📋 BATCH SUMMARY")
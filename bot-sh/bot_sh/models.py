@@ -1,7 +1,8 @@
+import functools
 from dataclasses import dataclass
 
 
-POSITIONS = [
+POSITIONS = (
     "GK",
     "RB",
     "RWB",
@@ -26,7 +27,10 @@ POSITIONS = [
     "ST",
     "RST",
     "LST",
-]
+)
+
+POSITION_INDEX = {position: i for i, position in enumerate(POSITIONS)}
+POSITIONS_SET = frozenset(POSITIONS)
 
 LINEUP_POSITIONS = {
     "3-4-3": ["LCB", "CB", "RCB", "RWB", "RCM", "LCM", "LWB", "RW", "ST", "LW"],
@@ -58,20 +62,17 @@ LINEUP_POSITIONS = {
 }
 
 
+@functools.lru_cache(maxsize=64)
 def normalize_lineup_name(lineup_name: str) -> str:
     return "-".join(lineup_name.strip().lower().split())
 
 
-def get_lineup_positions(lineup_name: str) -> list[str] | None:
-    normalized = normalize_lineup_name(lineup_name)
-    positions = LINEUP_POSITIONS.get(normalized)
-    if not positions:
-        return None
-    return ["GK", *positions]
+def get_lineup_positions(lineup_name: str) -> tuple[str, ...] | None:
+    return _LINEUP_POSITIONS_WITH_GK.get(normalize_lineup_name(lineup_name))
 
 
 def _validate_lineups() -> None:
-    allowed_lineup_positions = set(POSITIONS) | {"CF", "RCAM", "LCAM"}
+    allowed_lineup_positions = POSITIONS_SET | {"CF", "RCAM", "LCAM"}
     for lineup, positions in LINEUP_POSITIONS.items():
         if len(positions) != 10:
             raise ValueError(
@@ -86,6 +87,10 @@ def _validate_lineups() -> None:
 
 _validate_lineups()
 
+_LINEUP_POSITIONS_WITH_GK = {
+    lineup: ("GK", *positions) for lineup, positions in LINEUP_POSITIONS.items()
+}
+
 
 DEFAULT_STATS = [
     "wasFouled",
@@ -131,12 +136,25 @@ CLI_STAT_MAPPING = {
     "yellow_cards": "yellowCard",
 }
 
+# CLI_STAT_MAPPING keyed by the hyphenated spelling only; callers fold
+# underscores to hyphens once instead of carrying both aliases.
+CANONICAL_STAT_MAPPING = {
+    key.replace("_", "-"): value for key, value in CLI_STAT_MAPPING.items()
+}
+
 
 DEFAULT_MATCH_NAME = "14:00 Deportivo Alavés"
 DEFAULT_HOME_TEAM = "Deportivo Alavés Deportivo"
 DEFAULT_AWAY_TEAM = "Real Sociedad Real Sociedad"
 
 
+@functools.lru_cache(maxsize=256)
+def normalize_team_names(home: str, away: str) -> tuple[str, str, str]:
+    """Return ``(home_display, away_display, file_slug)`` for a team-tab pair."""
+    slug = f"{home}_vs_{away}".replace(" ", "_").lower()
+    return home.title(), away.title(), slug
+
+
 @dataclass(frozen=True)
 class MatchEntry:
     match_url: str
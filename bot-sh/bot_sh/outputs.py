@@ -1,16 +1,82 @@
 import csv
 import json
 import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize ``data`` as indented UTF-8 JSON."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches json.dumps, which stringifies int keys.
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def loads_json(raw: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write ``data`` to ``path`` via a temp file so readers never see a torn file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(dumps_json(data))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def derive_alt_output_path(output_path: str) -> str:
-    if output_path.lower().endswith(".json"):
-        return output_path[:-5] + ".csv"
-    if output_path.lower().endswith(".csv"):
-        return output_path[:-4] + ".json"
+    root, ext = os.path.splitext(output_path)
+    ext = ext.lower()
+    if ext == ".json":
+        return root + ".csv"
+    if ext == ".csv":
+        return root + ".json"
     return output_path + ".csv"
 
 
+_CSV_HEADER = ("team", "stat", "position", "total", "average", "highest", "no_data")
+
+
+def _iter_csv_rows(all_collected_data: dict):
+    """Yield one CSV row per position so large results are never listed in memory."""
+    for team, stats_dict in all_collected_data.items():
+        for stat_name, positions in stats_dict.items():
+            for pos in positions:
+                yield (
+                    team,
+                    stat_name,
+                    pos.get("position", ""),
+                    pos.get("total", ""),
+                    pos.get("average", ""),
+                    pos.get("highest", ""),
+                    bool(pos.get("no_data", False)),
+                )
+
+
+def write_csv(all_collected_data: dict, output_path: str) -> None:
+    """Write one row per position to ``output_path``; errors propagate."""
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(_CSV_HEADER)
+        writer.writerows(_iter_csv_rows(all_collected_data))
+
+
 def save_results(all_collected_data: dict, output_path: str) -> None:
     try:
         if not output_path:
@@ -18,37 +84,11 @@ def save_results(all_collected_data: dict, output_path: str) -> None:
         out_dir = os.path.dirname(output_path) or "."
         os.makedirs(out_dir, exist_ok=True)
 
-        if output_path.lower().endswith(".csv"):
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        "team",
-                        "stat",
-                        "position",
-                        "total",
-                        "average",
-                        "highest",
-                        "no_data",
-                    ]
-                )
-                for team, stats_dict in all_collected_data.items():
-                    for stat_name, positions in stats_dict.items():
-                        for pos in positions:
-                            writer.writerow(
-                                [
-                                    team,
-                                    stat_name,
-                                    pos.get("position", ""),
-                                    pos.get("total", ""),
-                                    pos.get("average", ""),
-                                    pos.get("highest", ""),
-                                    bool(pos.get("no_data", False)),
-                                ]
-                            )
+        if os.path.splitext(output_path)[1].lower() == ".csv":
+            write_csv(all_collected_data, output_path)
         else:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(all_collected_data, f, ensure_ascii=False, indent=2)
+            with open(output_path, "wb") as f:
+                f.write(dumps_json(all_collected_data))
 
         print(f"✅ Saved results to {output_path}")
     except Exception as e:
@@ -1,13 +1,18 @@
 import re
+import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from .models import POSITIONS
 
+# Bottom of the position dialog: needs a scroll first and a short fast click.
+_STRIKER_POSITIONS = frozenset(("ST", "RST", "LST"))
 
-def _vprint(verbose: bool, message: str) -> None:
-    if verbose:
-        print(message)
+_DEBUG_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-artifacts")
+
+_INT_RE = re.compile(r"\d+")
+_FLOAT_RE = re.compile(r"[\d.]+")
 
 
 def navigate_to_match(
@@ -17,18 +22,98 @@ def navigate_to_match(
     verbose: bool = True,
 ) -> None:
     """Navigate to StatsHub and select a specific match."""
-    _vprint(verbose, "📍 Step 1: Navigating to StatsHub...")
+    if verbose:
+        print("📍 Step 1: Navigating to StatsHub...")
     page.goto("https://www.statshub.com/")
 
     label = date_filter.capitalize()
-    _vprint(verbose, f"📍 Step 2: Clicking '{label}' filter...")
+    if verbose:
+        print(f"📍 Step 2: Clicking '{label}' filter...")
     page.get_by_text(label, exact=True).click()
 
-    _vprint(verbose, f"📍 Step 3: Selecting match - {match_name}...")
+    if verbose:
+        print(f"📍 Step 3: Selecting match - {match_name}...")
     page.get_by_role("link", name=match_name).click()
 
-    _vprint(verbose, "📍 Step 4: Opening 'Opponent Stats'...")
-    page.get_by_role("button", name="Opponent Stats NEW!").click()
+    if verbose:
+        print("📍 Step 4: Opening 'Opponent Stats'...")
+    open_opponent_stats(page)
+
+
+# Settled = document complete and no new resource entries for ``min_settle_ms``.
+# ``token`` restarts the quiet window for every wait on the same document.
+_PAGE_SETTLED_JS = """
+({quietMs, token}) => {
+  if (document.readyState !== 'complete') return false;
+  const count = performance.getEntriesByType('resource').length;
+  const now = performance.now();
+  const state = window.__statshubSettle;
+  if (!state || state.token !== token || state.count !== count) {
+    if (!state || state.token !== token) performance.setResourceTimingBufferSize(10000);
+    window.__statshubSettle = {token, count, since: now};
+    return false;
+  }
+  return now - state.since >= quietMs;
+}
+"""
+
+
+def wait_for_page_settled(page, timeout_ms: int = 3000, min_settle_ms: int = 500) -> bool:
+    """Bounded stand-in for ``networkidle`` that ignores long-polling requests.
+
+    Returns False when ``timeout_ms`` elapses first; callers carry on either way.
+    """
+    try:
+        page.wait_for_function(
+            _PAGE_SETTLED_JS,
+            arg={"quietMs": min_settle_ms, "token": time.monotonic_ns()},
+            polling=100,
+            timeout=timeout_ms,
+        )
+        return True
+    except Exception:
+        return False
+
+
+# CSS beats a role/accessible-name query, and matching the prefix keeps
+# working once the "NEW!" badge is dropped.
+OPPONENT_STATS_BUTTON = 'button:has-text("Opponent Stats")'
+
+
+def open_opponent_stats(page) -> None:
+    page.locator(OPPONENT_STATS_BUTTON).first.click()
+
+
+_TEAM_TABS_READY_JS = "() => document.querySelectorAll('[role=\"tab\"]').length >= 2"
+
+
+def wait_for_team_tabs(page, timeout_ms: int = 5000) -> bool:
+    """Wait until both team tabs are rendered; False after ``timeout_ms``."""
+    try:
+        page.wait_for_function(_TEAM_TABS_READY_JS, timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+# For ``eval_on_selector_all('a[href*="/fixture/"]', ...)``: one {href, text}
+# per distinct href, first occurrence wins; duplicates are dropped before
+# their innerText is computed or sent back.
+FIXTURE_LINKS_JS = """
+els => {
+  const seen = new Set();
+  const out = [];
+  for (const e of els) {
+    const href = e.getAttribute('href');
+    if (!href || seen.has(href)) continue;
+    seen.add(href);
+    out.push({href, text: e.innerText});
+  }
+  return out;
+}
+"""
+# For ``eval_on_selector_all('[role="tab"]', ...)``: the non-empty tab labels.
+TAB_NAMES_JS = "els => els.map(e => (e.innerText || '').trim()).filter(Boolean)"
 
 
 def navigate_to_match_by_url(page, match_url: str, verbose: bool = True) -> None:
@@ -36,12 +121,15 @@ def navigate_to_match_by_url(page, match_url: str, verbose: bool = True) -> None
     if not match_url.startswith("http"):
         match_url = "https://www.statshub.com" + match_url
 
-    _vprint(verbose, f"📍 Step 1: Navigating directly to match: {match_url}")
-    page.goto(match_url)
-    page.wait_for_load_state("networkidle")
+    if verbose:
+        print(f"📍 Step 1: Navigating directly to match: {match_url}")
+    # The click below auto-waits for the button, so the DOM is enough here.
+    page.goto(match_url, wait_until="domcontentloaded")
 
-    _vprint(verbose, "📍 Step 2: Opening 'Opponent Stats'...")
-    page.get_by_role("button", name="Opponent Stats NEW!").click()
+    if verbose:
+        print("📍 Step 2: Opening 'Opponent Stats'...")
+    open_opponent_stats(page)
+    wait_for_team_tabs(page)
 
 
 def select_team_and_stat(
@@ -53,12 +141,14 @@ def select_team_and_stat(
 ) -> None:
     if stat_display is None:
         stat_display = stat_value
-    _vprint(verbose, f"📍 Step 5: Selecting team tab '{team_name}'...")
-    page.get_by_role("tab", name=team_name).click()
+    if verbose:
+        print(f"📍 Step 5: Selecting team tab '{team_name}'...")
+    switch_team_tab(page, team_name)
 
-    _vprint(verbose, f"📍 Step 6: Selecting stat '{stat_display}'...")
+    if verbose:
+        print(f"📍 Step 6: Selecting stat '{stat_display}'...")
     try:
-        page.get_by_label("Stat").select_option(stat_value)
+        select_stat(page, stat_value)
     except Exception:
         try:
             page.get_by_label("Stat").select_option(label=stat_display)
@@ -75,53 +165,188 @@ def select_team_and_stat(
             raise e2
 
 
+def select_stat(page, stat_value: str) -> bool:
+    """Select ``stat_value`` unless the Stat dropdown already shows it."""
+    stat_select = page.get_by_label("Stat")
+    if stat_select.input_value() == stat_value:
+        return False
+    stat_select.select_option(stat_value)
+    return True
+
+
+def switch_team_tab(page, team_name: str, timeout_ms: int = 5000) -> None:
+    """Click a team tab and wait until it is selected and its cards refresh.
+
+    The Stat selector stays visible across tabs, so waiting on it alone lets
+    the next read see the previous team's cards.
+    """
+    tab = page.get_by_role("tab", name=team_name)
+    if tab.get_attribute("aria-selected") == "true":
+        return
+    prev_snapshot = _read_stats_snapshot(page)
+    tab.click()
+    page.get_by_role("tab", name=team_name, selected=True).wait_for(
+        state="visible", timeout=timeout_ms
+    )
+    _wait_for_stats_update(page, prev_snapshot, timeout_ms=timeout_ms)
+
+
+def _write_debug_files(position: str, files: tuple[tuple[str, bytes], ...]) -> None:
+    try:
+        for path, data in files:
+            with open(path, "wb") as f:
+                f.write(data)
+        paths = ", ".join(path for path, _ in files)
+        print(f"   🐞 Saved debug artifacts for {position}: {paths}")
+    except Exception as e:
+        print(f"   ⚠️ Failed to save debug artifacts for {position}: {e}")
+
+
 def save_debug_artifacts(page, position: str, stats: dict) -> None:
+    """Capture the page for ``position`` and write it out in the background.
+
+    Capturing has to happen here on the Playwright thread; only the disk
+    writes are queued, and the executor drains them at interpreter exit.
+    """
     safe_pos = position.replace("/", "_")
     try:
-        html_path = f"debug_{safe_pos}.html"
-        png_path = f"debug_{safe_pos}.png"
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(page.content())
-        page.screenshot(path=png_path)
-        print(f"   🐞 Saved debug artifacts for {position}: {html_path}, {png_path}")
+        html = page.content().encode("utf-8")
+        png = page.screenshot()
     except Exception as e:
         print(f"   ⚠️ Failed to save debug artifacts for {position}: {e}")
+        return
+    _DEBUG_WRITER.submit(
+        _write_debug_files,
+        position,
+        ((f"debug_{safe_pos}.html", html), (f"debug_{safe_pos}.png", png)),
+    )
 
 
-def extract_position_stats(
-    page, position: str, debug: bool = False, wait_timeout_ms: int = 2000
-) -> dict:
-    start_wait = time.monotonic()
+# Finds the card for a label the way the ``text=<label>`` locators did: the
+# first text node containing the label, an exact match winning. Returns the
+# text of the card (the label element's parent).
+_LABEL_BLOB_JS = """
+(label) => {
+  const wanted = label.toLowerCase();
+  const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+  let fallback = null;
+  for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+    const text = node.nodeValue.trim().toLowerCase();
+    if (text === wanted) { fallback = node.parentElement; break; }
+    if (!fallback && text.includes(wanted)) fallback = node.parentElement;
+  }
+  return fallback && fallback.parentElement ? fallback.parentElement.textContent : '';
+}
+"""
+
+# Reads the no-data notice and the Total/Average/Highest cards in one round-trip.
+_READ_STAT_BLOBS_JS = f"""
+() => {{
+  if (/no data found/i.test(document.body.innerText)) return {{no_data: true}};
+  const blob = {_LABEL_BLOB_JS.strip()};
+  return {{
+    total: blob('Total'),
+    average: blob('Average'),
+    highest: blob('Highest'),
+    no_data: false,
+  }};
+}}
+"""
+
+# The no-data state plus the Total card text, so a notice left over from the
+# previous position does not count as a change.
+_STATS_SNAPSHOT_JS = f"""
+() => {{
+  const blob = {_LABEL_BLOB_JS.strip()};
+  const noData = /no data found/i.test(document.body.innerText);
+  return (noData ? 'no-data|' : 'data|') + blob('Total');
+}}
+"""
+
+# Resolves once the snapshot differs from ``prev`` and shows either a Total
+# card or the no-data notice. Some toggles legitimately leave the snapshot as
+# it was (two no-data views in a row), so an unchanged snapshot with content
+# also counts once it has held for ``stableMs``; ``token`` restarts that
+# window for every wait.
+_STATS_UPDATED_JS = f"""
+({{prev, token, stableMs}}) => {{
+  const current = ({_STATS_SNAPSHOT_JS.strip()})();
+  if (current === 'data|') return false;
+  if (current !== prev) return true;
+  const now = performance.now();
+  const state = window.__statshubStatsWait;
+  if (!state || state.token !== token) {{
+    window.__statshubStatsWait = {{token, since: now}};
+    return false;
+  }}
+  return now - state.since >= stableMs;
+}}
+"""
+
+
+# Installed once per collect call so each per-position read only ships a
+# short call expression; the ``null`` result means a reload dropped them.
+_INSTALL_STAT_READERS_JS = f"""
+() => {{
+  window.__statshubStatsSnapshot = {_STATS_SNAPSHOT_JS.strip()};
+  window.__statshubReadStats = {_READ_STAT_BLOBS_JS.strip()};
+}}
+"""
+_CALL_READ_STATS_JS = (
+    "() => window.__statshubReadStats ? window.__statshubReadStats() : null"
+)
+_CALL_STATS_SNAPSHOT_JS = (
+    "() => window.__statshubStatsSnapshot ? window.__statshubStatsSnapshot() : null"
+)
+
+
+def _install_stat_readers(page) -> None:
     try:
-        page.wait_for_load_state("networkidle", timeout=wait_timeout_ms)
+        page.evaluate(_INSTALL_STAT_READERS_JS)
     except Exception:
-        if debug:
-            elapsed = time.monotonic() - start_wait
-            print(f"   ⚠️ networkidle timeout after {elapsed:.2f}s for {position}")
+        pass
 
+
+def _read_stat_blobs(page) -> dict:
     try:
-        try:
-            if (
-                page.locator("text=No data found for the selected criteria").count() > 0
-                or page.locator("text=No data found").count() > 0
-            ):
-                return {
-                    "position": position,
-                    "total": "0",
-                    "average": "0.0",
-                    "highest": "0",
-                    "no_data": True,
-                }
-        except Exception:
-            pass
+        blobs = page.evaluate(_CALL_READ_STATS_JS)
+        if blobs is None:
+            blobs = page.evaluate(_READ_STAT_BLOBS_JS)
+        return blobs or {}
+    except Exception:
+        return {}
 
-        try:
-            page.wait_for_selector("text=Total", timeout=wait_timeout_ms)
-        except Exception:
+
+def _no_data_result(position: str) -> dict:
+    return {
+        "position": position,
+        "total": "0",
+        "average": "0.0",
+        "highest": "0",
+        "no_data": True,
+    }
+
+
+def _first_match(pattern: re.Pattern, text: str) -> str | None:
+    m = pattern.search(text)
+    return m.group() if m else None
+
+
+def extract_position_stats(page, position: str, debug: bool = False) -> dict:
+    """Read the stat cards for the selected position.
+
+    The caller waits for the cards to refresh (see ``_wait_for_stats_update``),
+    so this is a single read with no waiting of its own.
+    """
+    try:
+        blobs = _read_stat_blobs(page)
+        if blobs.get("no_data"):
+            return _no_data_result(position)
+
+        if not blobs.get("total"):
+            # The caller's update wait timed out and the cards never rendered.
             if debug:
-                print(
-                    f"   ⚠️ 'Total' selector timeout after {wait_timeout_ms}ms for {position}"
-                )
+                print(f"   ⚠️ 'Total' card missing for {position}")
                 save_debug_artifacts(
                     page,
                     position,
@@ -132,48 +357,11 @@ def extract_position_stats(
                         "highest": None,
                     },
                 )
-            return {
-                "position": position,
-                "total": "0",
-                "average": "0.0",
-                "highest": "0",
-                "no_data": True,
-            }
+            return _no_data_result(position)
 
-        try:
-            total_text = page.locator("text=Total").first.evaluate(
-                "el => el.parentElement.textContent"
-            )
-        except Exception:
-            total_text = ""
-
-        total_value = (
-            re.search(r"\d+", total_text).group()
-            if re.search(r"\d+", total_text)
-            else None
-        )
-
-        average_loc = page.locator("text=Average").first
-        try:
-            average_text = average_loc.evaluate("el => el.parentElement.textContent")
-        except Exception:
-            average_text = ""
-        average_value = (
-            re.search(r"[\d.]+", average_text).group()
-            if re.search(r"[\d.]+", average_text)
-            else None
-        )
-
-        highest_loc = page.locator("text=Highest").first
-        try:
-            highest_text = highest_loc.evaluate("el => el.parentElement.textContent")
-        except Exception:
-            highest_text = ""
-        highest_value = (
-            re.search(r"\d+", highest_text).group()
-            if re.search(r"\d+", highest_text)
-            else None
-        )
+        total_value = _first_match(_INT_RE, blobs.get("total") or "")
+        average_value = _first_match(_FLOAT_RE, blobs.get("average") or "")
+        highest_value = _first_match(_INT_RE, blobs.get("highest") or "")
 
         result = {
             "position": position,
@@ -275,36 +463,48 @@ def _safe_click(
 
 
 def _position_locator(page, position: str):
-    return page.locator(f'[role="switch"][id="position-{position}"]')
+    """Locate the switch for ``position`` by id or exact accessible name.
+
+    ``or_`` makes this one selector query at action time instead of
+    ``count()`` probes per fallback. The old non-exact name fallback is
+    dropped: in a union ``first`` follows document order, so "ST" could
+    resolve to "RST".
+    """
+    return (
+        page.locator(f'[role="switch"][id="position-{position}"]')
+        .or_(page.get_by_role("switch", name=position, exact=True))
+        .first
+    )
 
 
-def _read_totals_blob(page) -> str:
+def _read_stats_snapshot(page) -> str:
     try:
-        return page.locator("text=Total").first.evaluate(
-            "el => el.parentElement.textContent || ''"
-        )
+        snapshot = page.evaluate(_CALL_STATS_SNAPSHOT_JS)
+        if snapshot is None:
+            snapshot = page.evaluate(_STATS_SNAPSHOT_JS)
+        return snapshot or ""
     except Exception:
         return ""
 
 
-def _wait_for_stats_update(page, prev_blob: str, timeout_ms: int = 2000) -> None:
+def _wait_for_stats_update(
+    page, prev_snapshot: str, timeout_ms: int = 2000, stable_ms: int = 750
+) -> str:
+    """Wait for the stat cards to refresh after a toggle; return the new snapshot."""
     try:
         page.wait_for_function(
-            """
-            (prev) => {
-              const noData = document.body.innerText.includes('No data found');
-              const totalEl = Array.from(document.querySelectorAll('*')).find(
-                el => el.textContent && el.textContent.includes('Total')
-              );
-              const blob = totalEl && totalEl.parentElement ? totalEl.parentElement.textContent : '';
-              return noData || (blob && blob !== prev);
-            }
-            """,
-            prev_blob,
+            _STATS_UPDATED_JS,
+            arg={
+                "prev": prev_snapshot,
+                "token": time.monotonic_ns(),
+                "stableMs": stable_ms,
+            },
+            polling=100,
             timeout=timeout_ms,
         )
     except Exception:
         pass
+    return _read_stats_snapshot(page)
 
 
 def _is_checked(locator) -> bool:
@@ -320,67 +520,6 @@ def _is_checked(locator) -> bool:
         return False
 
 
-def _ensure_state(locator, checked: bool, timeout_ms: int = 2000) -> bool:
-    desired = "true" if checked else "false"
-    try:
-        locator.wait_for(state="attached", timeout=timeout_ms)
-    except Exception:
-        return False
-    try:
-        locator.wait_for_attribute("aria-checked", desired, timeout=timeout_ms)
-        return True
-    except Exception:
-        try:
-            data_desired = "checked" if checked else "unchecked"
-            locator.wait_for_attribute("data-state", data_desired, timeout=timeout_ms)
-            return True
-        except Exception:
-            return False
-
-
-def _clear_all_positions(page) -> None:
-    for position in POSITIONS:
-        locator = _position_locator(page, position)
-        if locator.count() == 0:
-            locator = page.get_by_role("switch", name=position, exact=True)
-        if locator.count() == 0:
-            locator = page.get_by_role("switch", name=position)
-        if _is_checked(locator):
-            _safe_click(
-                page,
-                locator,
-                f"switch for {position} (clear)",
-                timeout_ms=1500,
-                fast_mode=False,
-            )
-            _ensure_state(locator, checked=False, timeout_ms=1500)
-
-
-def _set_switch_state(page, position: str, checked: bool, attempts: int = 3) -> bool:
-    for _ in range(attempts):
-        locator = _position_locator(page, position)
-        if locator.count() == 0:
-            locator = page.get_by_role("switch", name=position, exact=True)
-        if locator.count() == 0:
-            locator = page.get_by_role("switch", name=position)
-
-        current = _is_checked(locator)
-        if current == checked:
-            return True
-
-        # Try a fast JS click first, then normal click.
-        _safe_click(
-            page,
-            locator,
-            f"switch for {position} (set {checked})",
-            timeout_ms=1500,
-            fast_mode=False,
-        )
-        if _ensure_state(locator, checked=checked, timeout_ms=1500):
-            return True
-    return False
-
-
 def _scroll_positions_to_bottom(page) -> None:
     try:
         page.locator('[role="dialog"]').first.evaluate(
@@ -401,12 +540,14 @@ def collect_stats_for_all_positions(
 ) -> list:
     collected_data = []
 
-    _vprint(verbose, "📍 Step 7: Opening position selector...")
+    if verbose:
+        print("📍 Step 7: Opening position selector...")
     page.get_by_role("button", name="Select positions").click()
 
-    _vprint(
-        verbose, f"📍 Step 8: Collecting stats for all positions ({team_name})..."
-    )
+    if verbose:
+        print(f"📍 Step 8: Collecting stats for all positions ({team_name})...")
+
+    _install_stat_readers(page)
 
     spinner = None
     errors = []
@@ -416,20 +557,19 @@ def collect_stats_for_all_positions(
             total=len(POSITIONS),
         )
         spinner.start()
+    # Resolved once per sweep and reused for the on- and off-click.
+    switches = {position: _position_locator(page, position) for position in POSITIONS}
     for position in POSITIONS:
         try:
             start_time = time.monotonic()
-            if position in ["ST", "RST", "LST"]:
+            is_striker = position in _STRIKER_POSITIONS
+            if is_striker:
                 _scroll_positions_to_bottom(page)
 
-            locator = _position_locator(page, position)
-            if locator.count() == 0:
-                locator = page.get_by_role("switch", name=position, exact=True)
-            if locator.count() == 0:
-                locator = page.get_by_role("switch", name=position)
+            locator = switches[position]
 
-            is_striker = position in ["ST", "RST", "LST"]
             click_timeout = 500 if is_striker else 2000
+            prev_snapshot = _read_stats_snapshot(page)
             if not _safe_click(
                 page,
                 locator,
@@ -438,14 +578,13 @@ def collect_stats_for_all_positions(
                 fast_mode=is_striker,
             ):
                 raise Exception("Click failed")
+            position_snapshot = _wait_for_stats_update(page, prev_snapshot, timeout_ms=2000)
 
             if spinner:
                 spinner.step(position)
             elif debug:
                 print(f"   - Collecting data for {position}...")
-            stats = extract_position_stats(
-                page, position, debug=debug, wait_timeout_ms=2000
-            )
+            stats = extract_position_stats(page, position, debug=debug)
             collected_data.append(stats)
             if debug:
                 print(
@@ -453,28 +592,25 @@ def collect_stats_for_all_positions(
                 )
 
             try:
-                off_locator = _position_locator(page, position)
-                if off_locator.count() == 0:
-                    off_locator = page.get_by_role("switch", name=position, exact=True)
-                if off_locator.count() == 0:
-                    off_locator = page.get_by_role("switch", name=position)
-                _safe_click(
-                    page,
-                    off_locator,
-                    f"turning off switch for {position}",
-                    timeout_ms=2000,
-                    fast_mode=False,
-                )
-                if _is_checked(off_locator):
+                # The switch was just clicked, so skip actionability checks;
+                # a real click is the fallback if the event was ignored.
+                try:
+                    locator.dispatch_event("click", timeout=1000)
+                except Exception:
+                    pass
+                if _is_checked(locator):
                     _safe_click(
                         page,
-                        off_locator,
+                        locator,
                         f"turning off switch for {position} (retry)",
                         timeout_ms=2000,
                         fast_mode=False,
                     )
             except Exception:
                 print(f"   ⚠️ Failed turning off switch for {position}")
+            # Wait for the off-toggle's own refresh before the next position
+            # snapshots the cards, or it would count as that position's change.
+            _wait_for_stats_update(page, position_snapshot, timeout_ms=2000)
 
             elapsed = time.monotonic() - start_time
             if debug and elapsed > per_position_timeout_s:
@@ -499,11 +635,14 @@ class _Spinner:
         self._total = total
         self._current = 0
         self._stop = threading.Event()
+        # Redrawing with \r only makes sense on a terminal.
+        self._animate = sys.stdout.isatty()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
 
     def start(self) -> None:
-        self._thread.start()
+        if self._animate:
+            self._thread.start()
 
     def step(self, label: str) -> None:
         self._current += 1
@@ -511,14 +650,18 @@ class _Spinner:
 
     def stop(self) -> None:
         self._stop.set()
-        self._thread.join(timeout=1)
+        if self._thread.is_alive():
+            self._thread.join(timeout=1)
         print("\r✅ Positions collected".ljust(80))
 
     def _run(self) -> None:
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        chars = self._chars
         i = 0
-        while not self._stop.is_set():
-            ch = self._chars[i % len(self._chars)]
-            msg = f"\r{ch} {self._text}"
-            print(msg.ljust(80), end="", flush=True)
-            time.sleep(0.1)
+        while True:
+            write(f"\r{chars[i % len(chars)]} {self._text:<76}")
+            flush()
+            if self._stop.wait(0.25):
+                break
             i += 1
@@ -18,4 +18,6 @@ if __name__ == "__main__":
         match_name=args.match,
         home_team_name=args.home_team,
         away_team_name=args.away_team,
+        profile_dir=args.profile_dir,
+        parallel_teams=args.parallel_teams,
     )
@@ -1,19 +1,94 @@
 #!/usr/bin/env python3
 """Extract correct team tab names (UPPERCASE) and match URLs for batch processing."""
 
-from playwright.sync_api import sync_playwright
 import re
-import json
 
+from bot_sh import scraper
+from bot_sh.browser import BrowserSession, add_profile_dir_argument, map_with_sessions
+from bot_sh.outputs import write_json_atomic
 
-def extract_match_info(date_filter: str = "today"):
-    """Extract all matches with team names and URLs for a specific date."""
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
+_FIXTURE_RE = re.compile(r"/fixture/([^/]+)/(\d+)")
+_HREFS_JS = "els => els.map(e => e.getAttribute('href'))"
+
+
+def _words(text: str) -> set[str]:
+    return set(text.upper().replace("-", " ").split())
+
+
+def _match_team_tabs(
+    tab_names: list[str], home_name: str, away_name: str
+) -> tuple[str | None, str | None]:
+    """Pick the tab sharing the most words with each team name.
+
+    The away side only considers tabs other than the chosen home tab, so a
+    word both names share cannot map them to the same tab.
+    """
+    home_set = _words(home_name)
+    away_set = _words(away_name)
+    scores = []
+    for t in tab_names:
+        words = _words(t)
+        scores.append((t, len(home_set & words), len(away_set & words)))
 
+    home_tab = None
+    best = max(scores, key=lambda s: s[1], default=None)
+    if best and best[1] > 0:
+        home_tab = best[0]
+    best = max(
+        (s for s in scores if s[0] != home_tab), key=lambda s: s[2], default=None
+    )
+    away_tab = best[0] if best and best[2] > 0 else None
+    return home_tab, away_tab
+
+
+def _extract_match_tabs(page, match: dict) -> dict | None:
+    """Open one fixture and attach its UPPERCASE team tab names to ``match``."""
+    label = f"{match['home_team_slug']} vs {match['away_team_slug']}"
+    try:
+        page.goto("https://www.statshub.com" + match["match_url"])
+
+        # Click Opponent Stats button (click() waits for it to render)
         try:
+            scraper.open_opponent_stats(page)
+            scraper.wait_for_team_tabs(page)
+        except Exception as e:
+            print(f"  ⚠️ {label}: could not click Opponent Stats: {e}")
+            # continue anyway to attempt reading tabs
+
+        # Read the visible (uppercase) text of every role=tab element in one call
+        tab_names = page.eval_on_selector_all('[role="tab"]', scraper.TAB_NAMES_JS)
+
+        # Find home and away team tab names by matching slug words against tab text
+        home_tab, away_tab = _match_team_tabs(
+            tab_names, match["home_team_slug"], match["away_team_slug"]
+        )
+
+        if not home_tab or not away_tab:
+            # Fallback to positional mapping if we couldn't match by words
+            if len(tab_names) >= 2:
+                home_tab = tab_names[0]
+                away_tab = tab_names[1]
+                print(f"  {label}: using position-based tabs: {home_tab} vs {away_tab}")
+
+        if home_tab and away_tab:
+            match["home_team_tab"] = home_tab
+            match["away_team_tab"] = away_tab
+            print(f"  ✓ {label}: '{home_tab}' vs '{away_tab}'")
+            return match
+        print(f"  ✗ {label}: could not determine team tabs. Found: {tab_names}")
+    except Exception as e:
+        print(f"  ✗ {label}: error extracting team tabs: {e}")
+    return None
+
+
+def extract_match_info(
+    date_filter: str = "today",
+    concurrency: int = 4,
+    profile_dir: str | None = None,
+):
+    """Extract all matches with team names and URLs for a specific date."""
+    with BrowserSession(headless=True, user_data_dir=profile_dir) as session:
+        with session.page() as page:
             print("📍 Navigating to StatsHub...")
             page.goto("https://www.statshub.com/")
             page.wait_for_load_state("networkidle")
@@ -21,152 +96,82 @@ def extract_match_info(date_filter: str = "today"):
             label = date_filter.capitalize()
             print(f"📍 Clicking '{label}' filter...")
             page.get_by_text(label, exact=True).click()
-            page.wait_for_load_state("networkidle")
+            scraper.wait_for_page_settled(page, timeout_ms=3000)
 
             print("📍 Extracting all matches and team names...")
 
-            # Get all match links with hrefs
-            match_links = page.locator('a[href*="/fixture/"]').all()
-            print(f"Found {len(match_links)} match links")
-
-            matches = []
-            seen_urls = set()
-
-            for link in match_links:
-                try:
-                    href = link.get_attribute("href")
-                    if href and href not in seen_urls:
-                        seen_urls.add(href)
-                        # Extract match name from href (e.g., "deportivo-alaves-vs-real-sociedad")
-                        match_id_pattern = r"/fixture/([^/]+)/(\d+)"
-                        m = re.search(match_id_pattern, href)
-                        if m:
-                            slug = m.group(
-                                1
-                            )  # e.g., "deportivo-alaves-vs-real-sociedad"
-                            match_id = m.group(2)
-
-                            # Extract team names from slug
-                            parts = slug.split("-vs-")
-                            if len(parts) == 2:
-                                home_slug = parts[0]
-                                away_slug = parts[1]
-
-                                # Clean up slugs to get display names
-                                # e.g., "deportivo-alaves" -> "Deportivo Alaves"
-                                home_name = " ".join(
-                                    word.capitalize() for word in home_slug.split("-")
-                                )
-                                away_name = " ".join(
-                                    word.capitalize() for word in away_slug.split("-")
-                                )
-
-                                matches.append(
-                                    {
-                                        "home_team_slug": home_name,
-                                        "away_team_slug": away_name,
-                                        "match_url": href,
-                                        "match_id": match_id,
-                                    }
-                                )
-                                print(f"  ✓ {home_name} vs {away_name}: {href}")
-                except Exception as e:
-                    print(f"  ✗ Error processing link: {e}")
-
-            # Remove duplicates
-            unique_matches = []
-            seen = set()
-            for m in matches:
-                key = (m["home_team_slug"], m["away_team_slug"])
-                if key not in seen:
-                    unique_matches.append(m)
-                    seen.add(key)
+            # Get all match link hrefs in one call
+            hrefs = page.eval_on_selector_all('a[href*="/fixture/"]', _HREFS_JS)
+            print(f"Found {len(hrefs)} match links")
+
+            # Keyed by team pair: the same fixture is linked several times per page
+            unique: dict[tuple[str, str], dict] = {}
+
+            for href in hrefs:
+                # Extract match name from href (e.g., "deportivo-alaves-vs-real-sociedad")
+                m = _FIXTURE_RE.search(href or "")
+                if not m:
+                    continue
+                slug, match_id = m.groups()
+
+                # Extract team names from slug
+                parts = slug.split("-vs-")
+                if len(parts) != 2:
+                    continue
+                home_slug, away_slug = parts
+
+                # Clean up slugs to get display names
+                # e.g., "deportivo-alaves" -> "Deportivo Alaves"
+                home_name = " ".join(word.capitalize() for word in home_slug.split("-"))
+                away_name = " ".join(word.capitalize() for word in away_slug.split("-"))
+
+                key = (home_name, away_name)
+                if key in unique:
+                    continue
+                unique[key] = {
+                    "home_team_slug": home_name,
+                    "away_team_slug": away_name,
+                    "match_url": href,
+                    "match_id": match_id,
+                }
+                print(f"  ✓ {home_name} vs {away_name}: {href}")
+
+            unique_matches = list(unique.values())
 
             print(f"\n📊 Found {len(unique_matches)} unique matches")
 
-            # Now, click on each match and extract the actual team tab names (UPPERCASE)
-            matches_with_tabs = []
-            for i, match in enumerate(unique_matches):
-                print(
-                    f"\n[{i+1}/{len(unique_matches)}] Extracting team tab names for {match['home_team_slug']} vs {match['away_team_slug']}..."
-                )
-                try:
-                    page.goto("https://www.statshub.com" + match["match_url"])
-                    page.wait_for_load_state("networkidle")
-
-                    # Click Opponent Stats button
-                    try:
-                        page.get_by_role("button", name="Opponent Stats NEW!").click()
-                        page.wait_for_load_state("networkidle")
-                    except Exception as e:
-                        print(f"  ⚠️ Could not click Opponent Stats: {e}")
-                        # continue anyway to attempt reading tabs
-
-                    # Get all elements with role=tab and read their visible (uppercase) text
-                    tabs = page.locator('[role="tab"]').all()
-                    tab_names = []
-                    for tab in tabs:
-                        try:
-                            text = tab.inner_text().strip()
-                            if text:
-                                tab_names.append(text)
-                        except Exception:
-                            pass
-
-                    # Find home and away team tab names by matching slug words against tab text
-                    home_tab = None
-                    away_tab = None
-
-                    def slug_to_words(slug):
-                        return [w for w in slug.replace("-", " ").split() if w]
-
-                    home_words = slug_to_words(match["home_team_slug"].lower())
-                    away_words = slug_to_words(match["away_team_slug"].lower())
-
-                    for t in tab_names:
-                        t_up = t.upper()
-                        if any(w.upper() in t_up for w in home_words):
-                            home_tab = t
-                        if any(w.upper() in t_up for w in away_words):
-                            away_tab = t
-
-                    if not home_tab or not away_tab:
-                        # Fallback to positional mapping if we couldn't match by words
-                        if len(tab_names) >= 2:
-                            home_tab = tab_names[0]
-                            away_tab = tab_names[1]
-                            print(
-                                f"  Using position-based tabs: {home_tab} vs {away_tab}"
-                            )
-
-                    if home_tab and away_tab:
-                        match["home_team_tab"] = home_tab
-                        match["away_team_tab"] = away_tab
-                        matches_with_tabs.append(match)
-                        print(f"  ✓ Team tabs: '{home_tab}' vs '{away_tab}'")
-                    else:
-                        print(f"  ✗ Could not determine team tabs. Found: {tab_names}")
-
-                except Exception as e:
-                    print(f"  ✗ Error extracting team tabs: {e}")
-
-            # Save results
-            output = {
-                "matches": matches_with_tabs,
-                "total_found": len(unique_matches),
-                "total_extracted_tabs": len(matches_with_tabs),
-            }
-
-            with open("team_tabs.json", "w", encoding="utf-8") as f:
-                json.dump(output, f, ensure_ascii=False, indent=2)
-
-            print(f"\n✅ Saved team tab information to team_tabs.json")
-            print(f"   Total unique matches: {len(unique_matches)}")
-            print(f"   Matches with team tabs extracted: {len(matches_with_tabs)}")
-
-        finally:
-            context.close()
-            browser.close()
+    # Now, open each match and extract the actual team tab names (UPPERCASE).
+    # Sync Playwright objects are thread-bound, so each worker gets its own browser.
+    print(
+        f"\n📍 Extracting team tab names for {len(unique_matches)} matches "
+        f"({max(1, min(concurrency, len(unique_matches)))} in parallel)..."
+    )
+
+    def _extract(session, index: int) -> dict | None:
+        with session.page() as page:
+            return _extract_match_tabs(page, unique_matches[index])
+
+    results = map_with_sessions(
+        _extract,
+        len(unique_matches),
+        workers=concurrency,
+        headless=True,
+        user_data_dir=profile_dir,
+    )
+    matches_with_tabs = [m for m in results if isinstance(m, dict)]
+
+    # Save results
+    output = {
+        "matches": matches_with_tabs,
+        "total_found": len(unique_matches),
+        "total_extracted_tabs": len(matches_with_tabs),
+    }
+
+    write_json_atomic("team_tabs.json", output)
+
+    print(f"\n✅ Saved team tab information to team_tabs.json")
+    print(f"   Total unique matches: {len(unique_matches)}")
+    print(f"   Matches with team tabs extracted: {len(matches_with_tabs)}")
 
 
 if __name__ == "__main__":
@@ -180,5 +185,16 @@ if __name__ == "__main__":
         default="today",
         help="Match date (default: today)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of match pages read in parallel (default: 4)",
+    )
+    add_profile_dir_argument(parser)
     args = parser.parse_args()
-    extract_match_info(date_filter=args.date)
+    extract_match_info(
+        date_filter=args.date,
+        concurrency=args.concurrency,
+        profile_dir=args.profile_dir,
+    )
@@ -3,20 +3,26 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import re
 import sys
+from operator import itemgetter
 from pathlib import Path
 
 import questionary
 
-from bot_sh import cli
+from bot_sh import cli, scraper
+from bot_sh.browser import BrowserSession, add_profile_dir_argument, map_with_sessions
 from bot_sh.models import CLI_STAT_MAPPING, LINEUP_POSITIONS, get_lineup_positions
-from playwright.sync_api import sync_playwright
+from bot_sh.outputs import loads_json, write_json_atomic
 
 
 PREFS_PATH = Path(__file__).with_name(".interactive_prefs.json")
+TABS_CACHE_PATH = Path(__file__).with_name(".tabs_cache.json")
+_FIXTURE_RE = re.compile(r"/fixture/([^/]+)/(\d+)")
+_TIME_RE = re.compile(r"\b(\d{1,2}:\d{2})\b")
+# Spaces and characters Windows/macOS reject in file names become "_".
+_SAFE_NAME_TABLE = str.maketrans({c: "_" for c in ' /\\:*?"<>|'})
 PREFERRED_STAT_KEYS = [
     "tackles",
     "fouls-won",
@@ -33,23 +39,27 @@ PREFERRED_STAT_KEYS = [
 PREFERRED_STAT_TO_INTERNAL = {
     key: CLI_STAT_MAPPING[key] for key in PREFERRED_STAT_KEYS if key in CLI_STAT_MAPPING
 }
+_DEFAULT_STATS_ARG = "tackles,fouls-won,fouls-committed,shots,shots-on-target"
+_DEFAULT_STATS = tuple(CLI_STAT_MAPPING[k] for k in _DEFAULT_STATS_ARG.split(","))
 
 
 def _load_prefs(path: Path) -> dict:
     if not path.exists():
         return {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        data = loads_json(path.read_bytes())
+    except (OSError, ValueError):  # unreadable or not JSON (json/orjson)
         return {}
+    return data if isinstance(data, dict) else {}
 
 
-def _save_prefs(path: Path, prefs: dict) -> None:
+def _save_prefs(path: Path, prefs: dict, previous: dict | None = None) -> None:
+    """Write ``prefs`` atomically; a no-op when they equal ``previous``."""
+    if prefs == previous:
+        return
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(prefs, f, ensure_ascii=False, indent=2)
-    except Exception:
+        write_json_atomic(str(path), prefs)
+    except OSError:
         pass
 
 
@@ -110,136 +120,124 @@ def _choose_output_single(default_choice: str, default_path: str) -> tuple[str |
     return path, False
 
 
-def _discover_matches(date_filter: str, headless: bool) -> list[dict]:
+def _discover_matches(page, date_filter: str) -> list[dict]:
     matches: list[dict] = []
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=headless)
-        context = browser.new_context()
-        page = context.new_page()
-        try:
-            page.goto("https://www.statshub.com/")
-            try:
-                page.wait_for_load_state("networkidle", timeout=8000)
-            except Exception:
-                # Some pages keep long-polling requests open; continue after a short settle delay.
-                page.wait_for_load_state("domcontentloaded", timeout=8000)
-                page.wait_for_timeout(1200)
-            label = date_filter.capitalize()
-            page.get_by_text(label, exact=True).click()
-            try:
-                page.wait_for_load_state("networkidle", timeout=8000)
-            except Exception:
-                page.wait_for_load_state("domcontentloaded", timeout=8000)
-                page.wait_for_timeout(1200)
-
-            links = page.locator('a[href*="/fixture/"]').all()
-            seen = set()
-            for link in links:
-                try:
-                    href = link.get_attribute("href")
-                    if not href or href in seen:
-                        continue
-                    seen.add(href)
-                    match_pattern = r"/fixture/([^/]+)/(\d+)"
-                    m = re.search(match_pattern, href)
-                    if not m:
-                        continue
-                    slug = m.group(1)
-                    parts = slug.split("-vs-")
-                    if len(parts) != 2:
-                        continue
-                    home_slug, away_slug = parts
-                    home = " ".join(w.capitalize() for w in home_slug.split("-"))
-                    away = " ".join(w.capitalize() for w in away_slug.split("-"))
-                    try:
-                        text = link.inner_text() or ""
-                    except Exception:
-                        text = ""
-                    time_match = re.search(r"\b(\d{1,2}:\d{2})\b", text)
-                    kickoff = time_match.group(1) if time_match else ""
-                    matches.append(
-                        {
-                            "match_url": href,
-                            "home_name": home,
-                            "away_name": away,
-                            "match_id": m.group(2),
-                            "kickoff_time": kickoff,
-                        }
-                    )
-                except Exception:
-                    continue
-        finally:
-            context.close()
-            browser.close()
+    # networkidle can hang on long-polling requests; click() waits for
+    # the date label and the settle wait covers the list re-render.
+    page.goto("https://www.statshub.com/", wait_until="domcontentloaded")
+    label = date_filter.capitalize()
+    page.get_by_text(label, exact=True).click()
+    scraper.wait_for_page_settled(page, timeout_ms=3000)
+    try:
+        page.locator('a[href*="/fixture/"]').first.wait_for(
+            state="attached", timeout=5000
+        )
+    except Exception:
+        pass
+
+    links = page.eval_on_selector_all('a[href*="/fixture/"]', scraper.FIXTURE_LINKS_JS)
+    for link in links:
+        href = link["href"]
+        m = _FIXTURE_RE.search(href)
+        if not m:
+            continue
+        slug = m.group(1)
+        parts = slug.split("-vs-")
+        if len(parts) != 2:
+            continue
+        home_slug, away_slug = parts
+        home = home_slug.replace("-", " ").title()
+        away = away_slug.replace("-", " ").title()
+        time_match = _TIME_RE.search(link.get("text") or "")
+        kickoff = time_match.group(1) if time_match else ""
+        matches.append(
+            {
+                "match_url": href,
+                "home_name": home,
+                "away_name": away,
+                "match_id": m.group(2),
+                "kickoff_time": kickoff,
+                "_label_lc": f"{home} {away}".lower(),
+            }
+        )
     return matches
 
 
-def _extract_tabs(match_url: str, headless: bool) -> tuple[str, str]:
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=headless)
-        context = browser.new_context()
-        page = context.new_page()
+def _extract_tabs(page, match_url: str) -> tuple[str, str]:
+    if not match_url.startswith("http"):
+        match_url = "https://www.statshub.com" + match_url
+    page.goto(match_url)
+    # click() waits for the button; then wait for the tabs we read next.
+    scraper.open_opponent_stats(page)
+    scraper.wait_for_team_tabs(page)
+
+    tab_names = page.eval_on_selector_all('[role="tab"]', scraper.TAB_NAMES_JS)
+    if len(tab_names) < 2:
+        raise RuntimeError("Could not detect team tabs.")
+    return tab_names[0], tab_names[1]
+
+
+def _extract_tabs_batch(
+    session: BrowserSession, match_urls: list[str], workers: int = 4
+) -> list[tuple[str, str] | Exception]:
+    """Read the team tabs of every match on a small pool of browsers.
+
+    A failure is returned in place of its match so the others still run. A
+    single match is read on ``session`` rather than launching a pool.
+    """
+
+    def _extract(worker_session, index: int) -> tuple[str, str] | Exception:
         try:
-            if not match_url.startswith("http"):
-                match_url = "https://www.statshub.com" + match_url
-            page.goto(match_url)
-            try:
-                page.wait_for_load_state("networkidle", timeout=15000)
-            except Exception:
-                page.wait_for_timeout(1500)
-            page.get_by_role("button", name="Opponent Stats NEW!").click()
-            try:
-                page.wait_for_load_state("networkidle", timeout=15000)
-            except Exception:
-                page.wait_for_timeout(1500)
+            with worker_session.page() as page:
+                return _extract_tabs(page, match_urls[index])
+        except Exception as e:
+            return e
+
+    if len(match_urls) <= 1:
+        return [_extract(session, i) for i in range(len(match_urls))]
+    return map_with_sessions(
+        _extract,
+        len(match_urls),
+        workers=workers,
+        headless=session.headless,
+        user_data_dir=session.user_data_dir,
+    )
 
-            tabs = page.locator('[role="tab"]').all()
-            tab_names = []
-            for tab in tabs:
-                try:
-                    text = tab.inner_text().strip()
-                    if text:
-                        tab_names.append(text)
-                except Exception:
-                    continue
-            if len(tab_names) < 2:
-                raise RuntimeError("Could not detect team tabs.")
-            return tab_names[0], tab_names[1]
-        finally:
-            context.close()
-            browser.close()
+
+def _tabs_cache_key(match: dict) -> str:
+    return str(match.get("match_id") or match.get("match_url"))
 
 
 def _sort_matches(matches: list[dict], sort_mode: str) -> list[dict]:
-    if sort_mode == "alpha":
-        return sorted(
-            matches,
-            key=lambda m: f"{m.get('home_name','')} vs {m.get('away_name','')}",
-        )
-    if sort_mode == "time":
-        def _time_key(m: dict):
-            t = m.get("kickoff_time") or ""
-            if not t:
-                return (99, 99, f"{m.get('home_name','')} vs {m.get('away_name','')}")
+    if sort_mode not in ("alpha", "time"):
+        return matches
+    # Decorate once so the sort compares plain tuples instead of calling a
+    # key function that formats the label on every comparison.
+    decorated = []
+    for m in matches:
+        label = f"{m.get('home_name','')} vs {m.get('away_name','')}"
+        hour = minute = 99
+        if sort_mode == "time" and m.get("kickoff_time"):
             try:
-                hour, minute = t.split(":")
-                return (int(hour), int(minute), f"{m.get('home_name','')} vs {m.get('away_name','')}")
-            except Exception:
-                return (99, 99, f"{m.get('home_name','')} vs {m.get('away_name','')}")
-        return sorted(matches, key=_time_key)
-    return matches
+                h, mm = m["kickoff_time"].split(":")
+                hour, minute = int(h), int(mm)
+            except ValueError:
+                pass
+        decorated.append((hour, minute, label, m))
+    decorated.sort(key=itemgetter(0, 1, 2))
+    return [d[3] for d in decorated]
 
 
 def _filter_matches(matches: list[dict], query: str) -> list[dict]:
     if not query:
         return matches
     q = query.strip().lower()
-    filtered = []
-    for m in matches:
-        label = f"{m.get('home_name','')} {m.get('away_name','')}".lower()
-        if q in label:
-            filtered.append(m)
-    return filtered
+    return [m for m in matches if q in (m.get("_label_lc") or _cache_label(m))]
+
+
+def _cache_label(m: dict) -> str:
+    m["_label_lc"] = f"{m.get('home_name','')} {m.get('away_name','')}".lower()
+    return m["_label_lc"]
 
 
 def _parse_args():
@@ -251,7 +249,7 @@ def _parse_args():
     parser.add_argument("--date", choices=["today", "tomorrow"], default="today")
     parser.add_argument(
         "--stats",
-        default="tackles,fouls-won,fouls-committed,shots,shots-on-target",
+        default=_DEFAULT_STATS_ARG,
     )
     parser.add_argument("--min-average", type=float, default=1.0)
     parser.add_argument("--headless", action="store_true", default=True)
@@ -271,10 +269,13 @@ def _parse_args():
     parser.add_argument("--filter", default="", help="Filter matches by substring")
     parser.add_argument("--yes", action="store_true", help="Skip confirmation prompt")
     parser.add_argument("--prefs", default=str(PREFS_PATH), help="Preferences file path")
+    add_profile_dir_argument(parser)
     return parser.parse_args()
 
 
 def _parse_stats_arg(stats_arg: str) -> list[str] | None:
+    if stats_arg == _DEFAULT_STATS_ARG:
+        return list(_DEFAULT_STATS)
     requested = [s.strip().lower() for s in stats_arg.split(",") if s.strip()]
     stats = []
     for value in requested:
@@ -286,14 +287,11 @@ def _parse_stats_arg(stats_arg: str) -> list[str] | None:
 def _internal_to_preferred_keys(stats: list[str] | None) -> list[str]:
     if not stats:
         return []
-    keys = []
-    for key, internal in PREFERRED_STAT_TO_INTERNAL.items():
-        if internal in stats:
-            keys.append(key)
-    return keys
+    stats_set = set(stats)
+    return [key for key, internal in PREFERRED_STAT_TO_INTERNAL.items() if internal in stats_set]
 
 
-def _ask_lineup_positions(team_name: str) -> list[str]:
+def _ask_lineup_positions(team_name: str) -> tuple[str, ...]:
     supported_lineups = ", ".join(sorted(LINEUP_POSITIONS.keys()))
     while True:
         raw = questionary.text(f"Confirmed lineup for {team_name}:").ask()
@@ -369,183 +367,210 @@ def main() -> None:
         output_path_default = prefs.get("output_path", "")
         output, output_both = _choose_output_single(output_default, output_path_default)
 
-    matches = _discover_matches(date_choice, headless=headless)
-    if not matches:
-        print("No matches found.")
-        return
-
-    if args.non_interactive:
-        matches = _filter_matches(matches, args.filter)
-        matches = _sort_matches(matches, args.sort)
+    # One browser serves discovery, single-match tab reads and every scrape.
+    with BrowserSession(headless=headless, user_data_dir=args.profile_dir) as session:
+        with session.page() as page:
+            matches = _discover_matches(page, date_choice)
+            # Later per-match contexts start from the homepage's cookies.
+            session.remember_storage_state(page)
         if not matches:
-            print("No matches found after filtering.")
+            print("No matches found.")
             return
-        if args.count == "all":
-            chosen_matches = matches
-        else:
-            try:
-                n = max(1, int(args.count))
-            except ValueError:
-                n = 1
-            chosen_matches = matches[:n]
-    else:
-        filter_query = questionary.text(
-            "Filter matches by team name (optional):", default=prefs.get("filter", "")
-        ).ask()
-        matches = _filter_matches(matches, filter_query)
-        if not matches:
-            retry = questionary.confirm(
-                "No matches found after filtering. Retry without filter?",
-                default=True,
-            ).ask()
-            if retry:
-                filter_query = ""
-                matches = _filter_matches(matches, filter_query)
-            else:
+
+        if args.non_interactive:
+            matches = _filter_matches(matches, args.filter)
+            matches = _sort_matches(matches, args.sort)
+            if not matches:
                 print("No matches found after filtering.")
                 return
-        sort_choice = questionary.select(
-            "Sort matches:",
-            choices=[
-                questionary.Choice("None (site order)", "none"),
-                questionary.Choice("Alphabetical", "alpha"),
-                questionary.Choice("Kickoff time", "time"),
-            ],
-            default=prefs.get("sort", "none"),
-        ).ask()
-        matches = _sort_matches(matches, sort_choice)
-
-        selection = questionary.select(
-            "How many matches to run?",
-            choices=[
-                questionary.Choice("All matches", "all"),
-                questionary.Choice("Pick 1 match", "one"),
-                questionary.Choice("Pick N matches", "n"),
-            ],
-            default=prefs.get("count_mode", "all"),
-        ).ask()
-        if selection == "all":
-            chosen_matches = matches
-        elif selection == "one":
-            choices = []
-            for m in matches:
-                label = f"{m.get('home_name')} vs {m.get('away_name')}"
-                choices.append(questionary.Choice(label, m))
-            chosen_matches = [
-                questionary.select(
-                    "Select match:",
-                    choices=choices,
-                ).ask()
-            ]
+            if args.count == "all":
+                chosen_matches = matches
+            else:
+                try:
+                    n = max(1, int(args.count))
+                except ValueError:
+                    n = 1
+                chosen_matches = matches[:n]
         else:
-            n_raw = questionary.text(
-                "How many matches?", default=str(prefs.get("count", 5))
+            filter_query = questionary.text(
+                "Filter matches by team name (optional):", default=prefs.get("filter", "")
             ).ask()
-            try:
-                n = max(1, int(n_raw))
-            except ValueError:
-                n = 5
-            if n > len(matches):
-                n = len(matches)
-            choices = []
-            for m in matches:
-                label = f"{m.get('home_name')} vs {m.get('away_name')}"
-                choices.append(questionary.Choice(label, m))
-            print("Available matches:")
-            for c in choices:
-                print(f"- {c.title}")
-            default_sel = None
-            while True:
-                selected = questionary.checkbox(
-                    f"Select {n} matches:",
-                    choices=choices,
-                    default=default_sel,
+            matches = _filter_matches(matches, filter_query)
+            if not matches:
+                retry = questionary.confirm(
+                    "No matches found after filtering. Retry without filter?",
+                    default=True,
                 ).ask()
-                if not selected:
-                    print("No matches selected.")
+                if retry:
+                    filter_query = ""
+                    matches = _filter_matches(matches, filter_query)
+                else:
+                    print("No matches found after filtering.")
                     return
-                if len(selected) != n:
-                    print(f"Please select exactly {n} matches.")
-                    continue
-                chosen_matches = selected
-                break
-
-    if args.dry_run:
-        print(
-            {
-                "mode": "user",
+            sort_choice = questionary.select(
+                "Sort matches:",
+                choices=[
+                    questionary.Choice("None (site order)", "none"),
+                    questionary.Choice("Alphabetical", "alpha"),
+                    questionary.Choice("Kickoff time", "time"),
+                ],
+                default=prefs.get("sort", "none"),
+            ).ask()
+            matches = _sort_matches(matches, sort_choice)
+
+            selection = questionary.select(
+                "How many matches to run?",
+                choices=[
+                    questionary.Choice("All matches", "all"),
+                    questionary.Choice("Pick 1 match", "one"),
+                    questionary.Choice("Pick N matches", "n"),
+                ],
+                default=prefs.get("count_mode", "all"),
+            ).ask()
+            if selection == "all":
+                chosen_matches = matches
+            elif selection == "one":
+                choices = []
+                for m in matches:
+                    label = f"{m.get('home_name')} vs {m.get('away_name')}"
+                    choices.append(questionary.Choice(label, m))
+                chosen_matches = [
+                    questionary.select(
+                        "Select match:",
+                        choices=choices,
+                    ).ask()
+                ]
+            else:
+                n_raw = questionary.text(
+                    "How many matches?", default=str(prefs.get("count", 5))
+                ).ask()
+                try:
+                    n = max(1, int(n_raw))
+                except ValueError:
+                    n = 5
+                if n > len(matches):
+                    n = len(matches)
+                choices = []
+                for m in matches:
+                    label = f"{m.get('home_name')} vs {m.get('away_name')}"
+                    choices.append(questionary.Choice(label, m))
+                print("Available matches:")
+                for c in choices:
+                    print(f"- {c.title}")
+                default_sel = None
+                while True:
+                    selected = questionary.checkbox(
+                        f"Select {n} matches:",
+                        choices=choices,
+                        default=default_sel,
+                    ).ask()
+                    if not selected:
+                        print("No matches selected.")
+                        return
+                    if len(selected) != n:
+                        print(f"Please select exactly {n} matches.")
+                        continue
+                    chosen_matches = selected
+                    break
+
+        if args.dry_run:
+            print(
+                {
+                    "mode": "user",
+                    "date": date_choice,
+                    "stats": stats,
+                    "min_average": min_average,
+                    "output": output,
+                    "output_both": output_both,
+                    "headless": headless,
+                    "matches": len(chosen_matches),
+                }
+            )
+            return
+
+        if not args.yes:
+            preview = "\n".join(
+                [f"- {m.get('home_name')} vs {m.get('away_name')}" for m in chosen_matches]
+            )
+            proceed = questionary.confirm(
+                "Proceed with these matches?\n" + preview,
+                default=True,
+            ).ask()
+            if not proceed:
+                print("Cancelled.")
+                return
+
+        if not args.non_interactive:
+            output_choice = (
+                "both"
+                if output_both
+                else ("terminal" if output is None else (Path(output).suffix.lstrip(".") or "terminal"))
+            )
+            prefs_update = {
                 "date": date_choice,
-                "stats": stats,
+                "stats": _internal_to_preferred_keys(stats),
                 "min_average": min_average,
-                "output": output,
-                "output_both": output_both,
                 "headless": headless,
-                "matches": len(chosen_matches),
+                "output": output_choice,
+                "output_path": output or "",
+                "filter": filter_query if "filter_query" in locals() else "",
+                "sort": sort_choice if "sort_choice" in locals() else "none",
+                "count_mode": selection if "selection" in locals() else "all",
+                "count": n if "n" in locals() else 1,
             }
-        )
+            _save_prefs(prefs_path, prefs_update, previous=prefs)
+
+        # Tab names never change for a fixture, so only unseen matches are opened.
+        tabs_cache = _load_prefs(TABS_CACHE_PATH)
+        tab_errors: dict[str, Exception] = {}
+        missing = [m for m in chosen_matches if _tabs_cache_key(m) not in tabs_cache]
+        if missing:
+            fetched = _extract_tabs_batch(
+                session, [m.get("match_url") for m in missing]
+            )
+            for m, tabs in zip(missing, fetched):
+                if isinstance(tabs, Exception):
+                    tab_errors[_tabs_cache_key(m)] = tabs
+                else:
+                    tabs_cache[_tabs_cache_key(m)] = list(tabs)
+            _save_prefs(TABS_CACHE_PATH, tabs_cache)
+
+        total = len(chosen_matches)
+        # Several matches get one file each: <root>_<home>_vs_<away><ext>.
+        per_match_output = total > 1 and bool(output)
+        out_root, out_ext = os.path.splitext(output) if output else ("", "")
+        for i, match in enumerate(chosen_matches, 1):
+            print(f"[{i}/{total}] {match.get('home_name')} vs {match.get('away_name')}")
+            key = _tabs_cache_key(match)
+            if key not in tabs_cache:
+                print(f"❌ Could not read team tabs: {tab_errors.get(key)}")
+                continue
+            match_url = match.get("match_url")
+            home_team, away_team = tabs_cache[key]
+            out_path = output
+            out_both = output_both
+            if per_match_output:
+                safe_name = f"{home_team} vs {away_team}".lower().translate(_SAFE_NAME_TABLE)
+                out_path = f"{out_root}_{safe_name}{out_ext}"
+                out_both = False
+
+            cli.run_single_by_url(
+                match_url=match_url,
+                home_team_tab=home_team,
+                away_team_tab=away_team,
+                min_average=min_average,
+                debug=False,
+                stats=stats,
+                headless=headless,
+                output=out_path,
+                output_both=out_both,
+                home_lineup_positions=confirmed_home_lineup_positions,
+                away_lineup_positions=confirmed_away_lineup_positions,
+                verbose=False,
+                session=session,
+            )
         return
 
-    if not args.yes:
-        preview = "\n".join(
-            [f"- {m.get('home_name')} vs {m.get('away_name')}" for m in chosen_matches]
-        )
-        proceed = questionary.confirm(
-            "Proceed with these matches?\n" + preview,
-            default=True,
-        ).ask()
-        if not proceed:
-            print("Cancelled.")
-            return
-
-    if not args.non_interactive:
-        output_choice = (
-            "both"
-            if output_both
-            else ("terminal" if output is None else (Path(output).suffix.lstrip(".") or "terminal"))
-        )
-        prefs_update = {
-            "date": date_choice,
-            "stats": _internal_to_preferred_keys(stats),
-            "min_average": min_average,
-            "headless": headless,
-            "output": output_choice,
-            "output_path": output or "",
-            "filter": filter_query if "filter_query" in locals() else "",
-            "sort": sort_choice if "sort_choice" in locals() else "none",
-            "count_mode": selection if "selection" in locals() else "all",
-            "count": n if "n" in locals() else 1,
-        }
-        _save_prefs(prefs_path, prefs_update)
-
-    for i, match in enumerate(chosen_matches, 1):
-        print(
-            f"[{i}/{len(chosen_matches)}] {match.get('home_name')} vs {match.get('away_name')}"
-        )
-        match_url = match.get("match_url")
-        home_team, away_team = _extract_tabs(match_url, headless=headless)
-        out_path = output
-        out_both = output_both
-        if len(chosen_matches) > 1 and output:
-            safe_name = f"{home_team} vs {away_team}".replace(" ", "_").lower()
-            out_path = f"{Path(output).stem}_{safe_name}{Path(output).suffix}"
-            out_both = False
-
-        cli.run_single_by_url(
-            match_url=match_url,
-            home_team_tab=home_team,
-            away_team_tab=away_team,
-            min_average=min_average,
-            debug=False,
-            stats=stats,
-            headless=headless,
-            output=out_path,
-            output_both=out_both,
-            home_lineup_positions=confirmed_home_lineup_positions,
-            away_lineup_positions=confirmed_away_lineup_positions,
-            verbose=False,
-        )
-    return
-
 
 if __name__ == "__main__":
     main()
@@ -1,10 +1,21 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
 import unittest
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from bot_sh.cli import stats_from_args_lenient, stats_from_args_strict
+from bot_sh.cli import (
+    _load_json,
+    _print_summary,
+    _strip_team_suffix,
+    stats_from_args_lenient,
+    stats_from_args_strict,
+)
 
 
 class TestCliStats(unittest.TestCase):
@@ -19,10 +30,54 @@ class TestCliStats(unittest.TestCase):
         with self.assertRaises(SystemExit):
             stats_from_args_strict("unknownstat", all_stats=False)
 
+    def test_stats_from_args_strict_underscore_and_spacing(self):
+        stats = stats_from_args_strict(" Fouls_Won , shots-on-target", all_stats=False)
+        self.assertEqual(stats, ["wasFouled", "onTargetScoringAttempt"])
+
     def test_stats_from_args_lenient(self):
         stats = stats_from_args_lenient("tackles,unknownstat")
         self.assertEqual(stats, ["totalTackle"])
 
+    def test_strip_team_suffix(self):
+        self.assertEqual(
+            _strip_team_suffix("Deportivo Alavés Deportivo"), "Deportivo Alavés"
+        )
+        self.assertEqual(
+            _strip_team_suffix("Real Sociedad Real Sociedad"), "Real Sociedad"
+        )
+        self.assertEqual(_strip_team_suffix("Barcelona"), "Barcelona")
+
+    def test_load_json_reloads_when_mtime_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "team_tabs.json")
+            Path(path).write_text(json.dumps({"matches": [1]}), encoding="utf-8")
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+            self.assertEqual(_load_json(path), {"matches": [1]})
+            self.assertIs(_load_json(path), _load_json(path))
+
+            Path(path).write_text(json.dumps({"matches": [2]}), encoding="utf-8")
+            os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+            self.assertEqual(_load_json(path), {"matches": [2]})
+
+    def test_print_summary_filters_and_sorts(self):
+        data = {
+            "Team A": {
+                "Tackles": [
+                    {"position": "CB", "total": "3", "average": "1.5", "highest": 2},
+                    {"position": "GK", "total": None, "average": "0.2", "highest": ""},
+                    {"position": "ST", "total": 10, "average": 2, "highest": 4},
+                ]
+            }
+        }
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            _print_summary(data, 1.0)
+        out = buf.getvalue()
+        self.assertNotIn("GK", out)
+        self.assertLess(out.index("ST"), out.index("CB"))
+        self.assertIn("1.50", out)
+        self.assertRegex(out, r"ST\s+10\s+2\s+4")
+
 
 if __name__ == "__main__":
     unittest.main()
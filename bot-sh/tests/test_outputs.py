@@ -9,7 +9,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from bot_sh.outputs import derive_alt_output_path, save_results
+from bot_sh.outputs import derive_alt_output_path, save_results, write_json_atomic
 
 
 class TestOutputs(unittest.TestCase):
@@ -17,6 +17,7 @@ class TestOutputs(unittest.TestCase):
         self.assertEqual(derive_alt_output_path("out.json"), "out.csv")
         self.assertEqual(derive_alt_output_path("out.csv"), "out.json")
         self.assertEqual(derive_alt_output_path("out"), "out.csv")
+        self.assertEqual(derive_alt_output_path("dir.v2/OUT.JSON"), "dir.v2/OUT.csv")
 
     def test_save_results_json(self):
         data = {
@@ -39,6 +40,17 @@ class TestOutputs(unittest.TestCase):
             self.assertIn("Team A", loaded)
             self.assertIn("Tackles", loaded["Team A"])
 
+    def test_write_json_atomic_replaces_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "team_tabs.json")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("stale")
+            write_json_atomic(path, {"matches": [{"home_team_tab": "ALAVÉS"}]})
+            with open(path, "r", encoding="utf-8") as f:
+                loaded = json.load(f)
+            self.assertEqual(loaded["matches"][0]["home_team_tab"], "ALAVÉS")
+            self.assertEqual(os.listdir(tmpdir), ["team_tabs.json"])
+
     def test_save_results_csv(self):
         data = {
             "Team A": {
@@ -4,13 +4,21 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import re
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
 try:
+    from rich.style import Style
     from rich.text import Text
     from textual.app import App, ComposeResult
     from textual.containers import Horizontal, Vertical
+    from textual.reactive import reactive
+    from textual.timer import Timer
     from textual.widgets import (
         Button,
         Checkbox,
@@ -25,6 +33,8 @@ try:
         SelectionList,
         Static,
     )
+    from textual.widgets.data_table import ColumnKey, RowKey
+    from textual.widgets.option_list import Option
 except ImportError as exc:  # pragma: no cover - runtime dependency guard
     raise SystemExit(
         "Missing dependency 'textual'. Install it with: pip install textual"
@@ -32,26 +42,137 @@ except ImportError as exc:  # pragma: no cover - runtime dependency guard
 
 from bot_sh.models import CLI_STAT_MAPPING, LINEUP_POSITIONS, get_lineup_positions
 
-from .constants import STAT_CHOICES, TUI_CSS
-from .helpers import display_name_for_cli_key, to_float
-from .services import collect_data, discover_matches
+from .constants import STAT_CHOICES
+from .helpers import display_name_for_cli_key, format_number, to_float
+from .services import close_thread_sessions, collect_data, discover_matches
+
+# (prompt, value, initially selected) for the stats SelectionList.
+_STAT_SELECTION_ITEMS = tuple((label, key, True) for key, label in STAT_CHOICES)
+# Shared so Average cells don't parse a color string each
+_ABOVE_MIN_STYLE = Style(color="green")
+_BELOW_MIN_STYLE = Style(color="red")
+_POOL_WORKERS = 2
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_LINEUP_ERROR = "ERROR: Unknown lineup. Supported: " + ", ".join(sorted(LINEUP_POSITIONS))
+
+
+class _Widget:
+    """Class attribute that resolves ``query_one(selector, widget_type)`` once.
+
+    The first access stores the widget in the instance ``__dict__``, which then
+    shadows this (non-data) descriptor, so later reads are plain attribute hits.
+    """
+
+    def __init__(self, selector: str, widget_type: type) -> None:
+        self.selector = selector
+        self.widget_type = widget_type
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, app, owner=None):
+        if app is None:
+            return self
+        widget = app.query_one(self.selector, self.widget_type)
+        app.__dict__[self.name] = widget
+        return widget
 
 
 class StatsHubTUI(App):
-    CSS = TUI_CSS
+    CSS_PATH = "tui.tcss"
     BINDINGS = [("q", "quit", "Quit")]
 
+    # True while a collection run is in progress; keeps Run and Confirm disabled
+    # whatever the flow state (see _sync_run_buttons).
+    running = reactive(False, init=False)
+
+    # state -> (right pane, match controls disabled, preview disabled, run disabled,
+    #           back disabled, confirm disabled); None leaves Preview as it is.
+    # Run and Confirm are additionally disabled while ``running``.
+    _FLOW_STATES: dict[str, tuple[str, bool, bool | None, bool, bool, bool]] = {
+        "config": ("preview", True, True, True, True, True),
+        "selection": ("selection", False, True, True, True, True),
+        "preview": ("preview", False, False, False, False, False),
+        "results": ("results", False, None, False, False, True),
+    }
+
+    # widget id -> methods to call when its value changes, in order
+    _CHANGE_EFFECTS: dict[str, tuple[str, ...]] = {
+        "has-lineups": ("_sync_lineup_flow", "_schedule_preview_refresh"),
+        "count-mode": ("_sync_mode_inputs", "_schedule_preview_refresh"),
+        "output-choice": ("_sync_mode_inputs", "_schedule_preview_refresh"),
+        **dict.fromkeys(
+            (
+                "headless",
+                "date-choice",
+                "sort-mode",
+                "min-average",
+                "output-path",
+                "count-n",
+                "home-lineup",
+                "away-lineup",
+            ),
+            ("_schedule_preview_refresh",),
+        ),
+    }
+
+    # The layout is composed once and never replaced, so lookups can be cached.
+    _apply_match_view_button = _Widget("#apply-match-view", Button)
+    _away_lineup = _Widget("#away-lineup", Input)
+    _away_lineup_label = _Widget("#away-lineup-label", Label)
+    _back_selection_button = _Widget("#back-selection", Button)
+    _confirm_run_button = _Widget("#confirm-run", Button)
+    _count_mode = _Widget("#count-mode", Select)
+    _count_n_input = _Widget("#count-n", Input)
+    _date_choice = _Widget("#date-choice", Select)
+    _has_lineups = _Widget("#has-lineups", Checkbox)
+    _headless_checkbox = _Widget("#headless", Checkbox)
+    _home_lineup = _Widget("#home-lineup", Input)
+    _home_lineup_label = _Widget("#home-lineup-label", Label)
+    _lineup_mode_note = _Widget("#lineup-mode-note", Static)
+    _match_list = _Widget("#match-list", SelectionList)
+    _min_average_input = _Widget("#min-average", Input)
+    _output_choice = _Widget("#output-choice", Select)
+    _output_path_input = _Widget("#output-path", Input)
+    _preview_button = _Widget("#preview", Button)
+    _preview_card = _Widget("#preview-card", Vertical)
+    _results_card = _Widget("#results-card", Vertical)
+    _results_table = _Widget("#results-table", DataTable)
+    _run_button = _Widget("#run", Button)
+    _run_log = _Widget("#run-log", RichLog)
+    _run_summary = _Widget("#run-summary", Static)
+    _selection_card = _Widget("#selection-card", Vertical)
+    _sort_mode = _Widget("#sort-mode", Select)
+    _stat_tabs = _Widget("#stat-tabs", OptionList)
+    _stats_list = _Widget("#stats-list", SelectionList)
+    _team_filter_input = _Widget("#team-filter", Input)
+
     def __init__(self, headless: bool = True) -> None:
         super().__init__()
         self.default_headless = headless
         self._selected_stats: list[str] = []
         self._selected_display_stats: list[str] = []
-        self._selected_display_to_cli: dict[str, str] = {}
         self._current_stat: str | None = None
         self._last_data: dict = {}
+        self._min_average_cached = 1.0
+        self._rendered_rows: dict[str, list[tuple[str, str, str, float, str, str]]] = {}
+        # (row key, average, average text) for the rows currently in the table
+        self._average_cells: list[tuple[RowKey, float, str]] = []
+        self._average_column: ColumnKey | None = None
         self._discovered_matches: list[dict] = []
         self._visible_matches: list[dict] = []
         self._flow_state = "config"
+        self._preview_timer: Timer | None = None
+        self._log_queue: deque[str] = deque()
+        self._log_timer: Timer | None = None
+        # Settings part of the preview; dropped whenever a setting changes
+        self._preview_header: str | None = None
+        # Reused across runs so repeated Discover/Run clicks don't spawn new threads
+        self._pool = ThreadPoolExecutor(max_workers=_POOL_WORKERS, thread_name_prefix="statshub-io")
+        self._pool_futures: set[Future] = set()
+        # date filter -> in-flight or finished discovery started before the click
+        self._discover_cache: dict[str, asyncio.Future] = {}
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -78,10 +199,7 @@ class StatsHubTUI(App):
                 yield Input(placeholder="Away lineup (e.g., 4-3-3)", id="away-lineup", disabled=True)
 
                 yield Label("3) Stats", classes="field-label")
-                yield SelectionList(
-                    *[(label, key, True) for key, label in STAT_CHOICES],
-                    id="stats-list",
-                )
+                yield SelectionList(*_STAT_SELECTION_ITEMS, id="stats-list")
 
                 yield Label("4) Minimum Average", classes="field-label")
                 yield Input(value="1.0", id="min-average")
@@ -140,7 +258,7 @@ class StatsHubTUI(App):
                     table = DataTable(id="results-table")
                     table.cursor_type = "row"
                     yield table
-                    yield RichLog(id="run-log", wrap=True, highlight=True, markup=False)
+                    yield RichLog(id="run-log", wrap=True, highlight=True, markup=False, max_lines=500)
 
         yield Footer()
 
@@ -150,163 +268,240 @@ class StatsHubTUI(App):
         self._sync_mode_inputs()
         self._sync_lineup_flow()
         self._set_flow_state("config")
+        # Most sessions start with today's fixtures; fetch them while the user configures
+        self._discover_cache["today"] = asyncio.ensure_future(
+            self._run_blocking(discover_matches, "today", self.default_headless)
+        )
+
+    def watch_running(self, running: bool) -> None:
+        self._sync_run_buttons()
+
+    def _sync_run_buttons(self) -> None:
+        """Apply the flow state's Run/Confirm flags, forced off while running."""
+        _, _, _, run_disabled, _, confirm_disabled = self._FLOW_STATES[self._flow_state]
+        self._run_button.disabled = run_disabled or self.running
+        self._confirm_run_button.disabled = confirm_disabled or self.running
+
+    def on_unmount(self) -> None:
+        for pending in self._discover_cache.values():
+            pending.cancel()
+        for future in list(self._pool_futures):
+            future.cancel()
+        # Each worker thread keeps its own browser open (see services), and sync
+        # Playwright must be closed on the thread that opened it. The barrier
+        # holds every close task until one is running on each worker thread.
+        barrier = threading.Barrier(_POOL_WORKERS)
+
+        def _close_worker_browsers() -> None:
+            try:
+                barrier.wait(timeout=5)
+            except threading.BrokenBarrierError:
+                pass  # a worker is still busy; its browser ends with the process
+            close_thread_sessions()
+
+        for _ in range(_POOL_WORKERS):
+            self._pool.submit(_close_worker_browsers)
+        self._pool.shutdown(wait=False)
+
+    async def _run_blocking(self, func, *args):
+        """Run a blocking Playwright call on the app's worker pool."""
+        future = self._pool.submit(functools.partial(func, *args))
+        self._pool_futures.add(future)
+        future.add_done_callback(self._pool_futures.discard)
+        return await asyncio.wrap_future(future)
+
+    async def _discover(self, date_choice: str) -> list[dict]:
+        """Use a pre-warmed discovery once, otherwise fetch fresh matches."""
+        prewarmed = self._discover_cache.pop(date_choice, None)
+        if prewarmed is not None:
+            try:
+                return await prewarmed
+            except Exception:
+                pass  # fall back to a fresh discovery below
+        return await self._run_blocking(discover_matches, date_choice, self.default_headless)
 
     def _set_right_mode(self, mode: str) -> None:
-        preview_card = self.query_one("#preview-card", Vertical)
-        selection_card = self.query_one("#selection-card", Vertical)
-        results_card = self.query_one("#results-card", Vertical)
-        preview_card.display = mode == "preview"
-        selection_card.display = mode == "selection"
-        results_card.display = mode == "results"
+        self._preview_card.display = mode == "preview"
+        self._selection_card.display = mode == "selection"
+        self._results_card.display = mode == "results"
 
     def _set_flow_state(self, state: str) -> None:
         self._flow_state = state
-        back_button = self.query_one("#back-selection", Button)
-        confirm_button = self.query_one("#confirm-run", Button)
-        if state == "config":
-            self._set_right_mode("preview")
-            self.query_one("#apply-match-view", Button).disabled = True
-            self.query_one("#count-mode", Select).disabled = True
-            self.query_one("#count-n", Input).disabled = True
-            self.query_one("#match-list", SelectionList).disabled = True
-            self.query_one("#preview", Button).disabled = True
-            self.query_one("#run", Button).disabled = True
-            back_button.disabled = True
-            confirm_button.disabled = True
-            return
-
-        if state == "selection":
-            self._set_right_mode("selection")
-            self.query_one("#apply-match-view", Button).disabled = False
-            self.query_one("#count-mode", Select).disabled = False
-            self.query_one("#match-list", SelectionList).disabled = False
-            self._sync_mode_inputs()
-            self.query_one("#preview", Button).disabled = True
-            self.query_one("#run", Button).disabled = True
-            back_button.disabled = True
-            confirm_button.disabled = True
-            return
-
-        if state == "preview":
-            self._set_right_mode("preview")
-            self.query_one("#apply-match-view", Button).disabled = False
-            self.query_one("#count-mode", Select).disabled = False
-            self.query_one("#match-list", SelectionList).disabled = False
-            self._sync_mode_inputs()
-            self.query_one("#preview", Button).disabled = False
-            self.query_one("#run", Button).disabled = False
-            back_button.disabled = False
-            confirm_button.disabled = False
-            return
-
-        if state == "results":
-            self._set_right_mode("results")
-            self.query_one("#apply-match-view", Button).disabled = False
-            self.query_one("#count-mode", Select).disabled = False
-            self.query_one("#match-list", SelectionList).disabled = False
-            self._sync_mode_inputs()
-            back_button.disabled = False
-            confirm_button.disabled = True
+        mode, lists_disabled, preview_disabled, _, back_disabled, _ = self._FLOW_STATES[state]
+        self._set_right_mode(mode)
+        self._apply_match_view_button.disabled = lists_disabled
+        self._count_mode.disabled = lists_disabled
+        self._match_list.disabled = lists_disabled
+        self._sync_mode_inputs()
+        if preview_disabled is not None:
+            self._preview_button.disabled = preview_disabled
+        self._back_selection_button.disabled = back_disabled
+        self._sync_run_buttons()
 
     def _setup_results_table(self) -> None:
-        table = self.query_one("#results-table", DataTable)
+        table = self._results_table
         table.clear(columns=True)
-        table.add_columns("Team", "Position", "Total", "Average", "Highest")
+        keys = table.add_columns("Team", "Position", "Total", "Average", "Highest")
+        self._average_column = keys[3]
 
     def _log(self, message: str) -> None:
-        self.query_one("#run-log", RichLog).write(message)
+        # Coalesce bursts of log lines into one RichLog write per 50 ms
+        self._log_queue.append(message)
+        if self._log_timer is None:
+            self._log_timer = self.set_timer(0.05, self._flush_logs)
+
+    def _flush_logs(self) -> None:
+        self._log_timer = None
+        if self._log_queue:
+            self._run_log.write("\n".join(self._log_queue))
+            self._log_queue.clear()
 
     def _set_summary(self, text: str) -> None:
-        self.query_one("#run-summary", Static).update(text)
+        self._run_summary.update(text)
 
     def _parse_min_average(self) -> float:
-        raw = self.query_one("#min-average", Input).value.strip()
+        """Return the last parsed minimum; ``on_input_changed`` keeps it current."""
+        return self._min_average_cached
+
+    @staticmethod
+    def _min_average_from(raw: str) -> float:
         try:
-            return float(raw)
+            return float(raw.strip())
         except ValueError:
             return 1.0
 
     def _parse_count_n(self) -> int:
-        raw = self.query_one("#count-n", Input).value.strip()
+        raw = self._count_n_input.value.strip()
         try:
             return max(1, int(raw))
         except ValueError:
             return 1
 
     def _selected_stat_keys(self) -> list[str]:
-        stats_widget = self.query_one("#stats-list", SelectionList)
+        stats_widget = self._stats_list
         return [value for value in stats_widget.selected if value in CLI_STAT_MAPPING]
 
     def _build_tabs_from_selection(self) -> None:
         stat_keys = self._selected_stat_keys()
+        if stat_keys == self._selected_stats:
+            return
         if not stat_keys:
             self._selected_stats = []
             self._selected_display_stats = []
-            self._selected_display_to_cli = {}
             self._current_stat = None
-            tabs = self.query_one("#stat-tabs", OptionList)
+            tabs = self._stat_tabs
             tabs.clear_options()
             self._render_selected_stat()
             return
 
         self._selected_stats = stat_keys
         self._selected_display_stats = [display_name_for_cli_key(key) for key in stat_keys]
-        self._selected_display_to_cli = {display_name_for_cli_key(key): key for key in stat_keys}
 
-        tabs = self.query_one("#stat-tabs", OptionList)
-        tabs.clear_options()
-        tabs.add_options(self._selected_display_stats)
+        tabs = self._stat_tabs
+        # Collected data is keyed by display name, so the option id is that name too
+        options = [Option(name, id=name) for name in self._selected_display_stats]
+        with self.batch_update():
+            tabs.clear_options()
+            tabs.add_options(options)
         self._current_stat = self._selected_display_stats[0]
         self._render_selected_stat()
 
+    def _set_last_data(self, data: dict) -> None:
+        """Store collected data and pre-sort/format its rows once per stat.
+
+        Rows only change after a run, so tab switches and re-renders just
+        rebuild the colored Average cell.
+        """
+        self._last_data = data
+        rendered: dict[str, list[tuple[str, str, str, float, str, str]]] = {}
+        for team, stats_dict in data.items():
+            for stat_name, positions in stats_dict.items():
+                team_rows = []
+                for position in positions:
+                    avg_val = to_float(position.get("average"))
+                    team_rows.append(
+                        (
+                            team,
+                            str(position.get("position", "")),
+                            format_number(to_float(position.get("total"))),
+                            avg_val,
+                            format_number(avg_val),
+                            format_number(to_float(position.get("highest"))),
+                        )
+                    )
+                team_rows.sort(key=itemgetter(3), reverse=True)
+                rendered.setdefault(stat_name, []).extend(team_rows)
+        self._rendered_rows = rendered
+
     def _render_selected_stat(self) -> None:
-        table = self.query_one("#results-table", DataTable)
-        table.clear()
+        table = self._results_table
+        self._average_cells = []
         if not self._current_stat:
+            table.clear()
             return
 
         min_average = self._parse_min_average()
-        rows: list[tuple[str, str, str, object, str]] = []
-        for team, stats_dict in self._last_data.items():
-            positions = list(stats_dict.get(self._current_stat, []))
-            positions.sort(key=lambda pos: to_float(pos.get("average")), reverse=True)
-            for position in positions:
-                avg_val = to_float(position.get("average"))
-                avg_text = str(int(avg_val)) if float(avg_val).is_integer() else f"{avg_val:.2f}"
-                avg_cell = Text(avg_text, style="green" if avg_val >= min_average else "red")
-                total_val = to_float(position.get("total"))
-                high_val = to_float(position.get("highest"))
-                total_text = str(int(total_val)) if float(total_val).is_integer() else f"{total_val:.2f}"
-                high_text = str(int(high_val)) if float(high_val).is_integer() else f"{high_val:.2f}"
-                rows.append((team, str(position.get("position", "")), total_text, avg_cell, high_text))
-
-        for row in rows:
-            table.add_row(*row)
+        rows = []
+        averages = []
+        for team, position, total_text, avg_val, avg_text, high_text in self._rendered_rows.get(self._current_stat, ()):
+            avg_cell = Text(avg_text, style=_ABOVE_MIN_STYLE if avg_val >= min_average else _BELOW_MIN_STYLE)
+            rows.append((team, position, total_text, avg_cell, high_text))
+            averages.append((avg_val, avg_text))
+
+        # Clear and refill in one batch so the table paints once per stat switch
+        with self.batch_update():
+            table.clear()
+            row_keys = table.add_rows(rows)
+        self._average_cells = [
+            (row_key, avg_val, avg_text)
+            for row_key, (avg_val, avg_text) in zip(row_keys, averages)
+        ]
+
+    def _recolor_averages(self, old_min: float, new_min: float) -> None:
+        """Restyle only the Average cells whose side of the threshold changed."""
+        if self._average_column is None:
+            return
+        table = self._results_table
+        for row_key, avg_val, avg_text in self._average_cells:
+            passes = avg_val >= new_min
+            if passes != (avg_val >= old_min):
+                table.update_cell(
+                    row_key,
+                    self._average_column,
+                    Text(avg_text, style=_ABOVE_MIN_STYLE if passes else _BELOW_MIN_STYLE),
+                )
+
+    def _index_matches(self, matches: list[dict]) -> None:
+        """Store sort and filter keys on each match once per discovery."""
+        for match in matches:
+            home = match.get("home_name", "")
+            away = match.get("away_name", "")
+            alpha = f"{home} vs {away}"
+            time_key = (99, 99, alpha)
+            kickoff = match.get("kickoff_time") or ""
+            if kickoff:
+                try:
+                    hour, minute = kickoff.split(":")
+                    time_key = (int(hour), int(minute), alpha)
+                except ValueError:
+                    pass
+            match["_alpha_key"] = alpha
+            match["_time_key"] = time_key
+            match["_label_lc"] = f"{home} {away}".lower()
+            match["_label"] = self._match_label(match)
 
     def _sort_matches(self, matches: list[dict], sort_mode: str) -> list[dict]:
         if sort_mode == "alpha":
-            return sorted(matches, key=lambda m: f"{m.get('home_name', '')} vs {m.get('away_name', '')}")
+            return sorted(matches, key=itemgetter("_alpha_key"))
         if sort_mode == "time":
-            def _time_key(match: dict) -> tuple[int, int, str]:
-                kickoff = match.get("kickoff_time") or ""
-                if not kickoff:
-                    return (99, 99, f"{match.get('home_name', '')} vs {match.get('away_name', '')}")
-                try:
-                    hour, minute = kickoff.split(":")
-                    return (int(hour), int(minute), f"{match.get('home_name', '')} vs {match.get('away_name', '')}")
-                except Exception:
-                    return (99, 99, f"{match.get('home_name', '')} vs {match.get('away_name', '')}")
-            return sorted(matches, key=_time_key)
+            return sorted(matches, key=itemgetter("_time_key"))
         return matches
 
     def _filter_matches(self, matches: list[dict], query: str) -> list[dict]:
-        if not query.strip():
-            return matches
         q = query.strip().lower()
-        return [
-            m for m in matches
-            if q in f"{m.get('home_name', '')} {m.get('away_name', '')}".lower()
-        ]
+        if not q:
+            return matches
+        return [m for m in matches if q in m["_label_lc"]]
 
     def _match_label(self, match: dict) -> str:
         kickoff = f" [{match.get('kickoff_time')}]" if match.get("kickoff_time") else ""
@@ -315,28 +510,31 @@ class StatsHubTUI(App):
     def _refresh_match_list(self) -> None:
         if self._flow_state == "config":
             return
-        filter_query = self.query_one("#team-filter", Input).value
-        sort_mode = str(self.query_one("#sort-mode", Select).value or "none")
+        filter_query = self._team_filter_input.value
+        sort_mode = str(self._sort_mode.value or "none")
         visible = self._filter_matches(self._discovered_matches, filter_query)
         visible = self._sort_matches(visible, sort_mode)
         self._visible_matches = visible
 
-        widget = self.query_one("#match-list", SelectionList)
-        widget.clear_options()
+        widget = self._match_list
         if not visible:
+            widget.clear_options()
             self._set_summary("No matches available with current filter.")
             self._set_flow_state("selection")
             return
 
-        options = [(self._match_label(match), str(match.get("match_url") or ""), False) for match in visible]
-        widget.add_options(options)
+        # Values index into _visible_matches, so selections map back without a URL scan
+        options = [(match["_label"], index, False) for index, match in enumerate(visible)]
+        with self.batch_update():
+            widget.clear_options()
+            widget.add_options(options)
         self._set_flow_state("selection")
         self._log(f"Match list updated: {len(visible)} visible.")
 
     def _selected_matches_for_run(self) -> tuple[list[dict] | None, str | None]:
-        mode = str(self.query_one("#count-mode", Select).value or "all")
-        selected_urls = set(self.query_one("#match-list", SelectionList).selected)
-        selected = [m for m in self._visible_matches if str(m.get("match_url") or "") in selected_urls]
+        mode = str(self._count_mode.value or "all")
+        visible = self._visible_matches
+        selected = [visible[index] for index in sorted(self._match_list.selected)]
 
         if mode == "all":
             if not self._visible_matches:
@@ -356,22 +554,22 @@ class StatsHubTUI(App):
         return selected, None
 
     def _sync_mode_inputs(self) -> None:
-        count_mode = str(self.query_one("#count-mode", Select).value or "all")
+        count_mode = str(self._count_mode.value or "all")
         if self._flow_state == "config":
-            self.query_one("#count-n", Input).disabled = True
+            self._count_n_input.disabled = True
         else:
-            self.query_one("#count-n", Input).disabled = count_mode != "n"
+            self._count_n_input.disabled = count_mode != "n"
 
-        output_choice = str(self.query_one("#output-choice", Select).value or "terminal")
-        self.query_one("#output-path", Input).disabled = output_choice == "terminal"
+        output_choice = str(self._output_choice.value or "terminal")
+        self._output_path_input.disabled = output_choice == "terminal"
 
     def _sync_lineup_flow(self) -> None:
-        has_lineups = bool(self.query_one("#has-lineups", Checkbox).value)
-        note = self.query_one("#lineup-mode-note", Static)
-        home_label = self.query_one("#home-lineup-label", Label)
-        home_lineup = self.query_one("#home-lineup", Input)
-        away_label = self.query_one("#away-lineup-label", Label)
-        away_lineup = self.query_one("#away-lineup", Input)
+        has_lineups = bool(self._has_lineups.value)
+        note = self._lineup_mode_note
+        home_label = self._home_lineup_label
+        home_lineup = self._home_lineup
+        away_label = self._away_lineup_label
+        away_lineup = self._away_lineup
 
         home_label.display = has_lineups
         home_lineup.display = has_lineups
@@ -389,8 +587,8 @@ class StatsHubTUI(App):
         note.update("Path: No confirmed lineups. Collector will use non-lineup flow.")
 
     def _output_settings(self) -> tuple[str | None, bool]:
-        choice = str(self.query_one("#output-choice", Select).value or "terminal")
-        raw_path = self.query_one("#output-path", Input).value.strip()
+        choice = str(self._output_choice.value or "terminal")
+        raw_path = self._output_path_input.value.strip()
         if choice == "terminal":
             return None, False
 
@@ -413,16 +611,24 @@ class StatsHubTUI(App):
         if total_matches <= 1:
             return base_output
         path = Path(base_output)
-        safe_name = re.sub(r"[^a-z0-9]+", "_", self._match_label(match).lower()).strip("_")
+        label = match.get("_label") or self._match_label(match)
+        safe_name = _SLUG_RE.sub("_", label.lower()).strip("_")
         if not path.suffix:
             return f"{base_output}_{safe_name}"
         return str(path.with_name(f"{path.stem}_{safe_name}{path.suffix}"))
 
     def _build_preview_text(self, chosen_matches: list[dict]) -> str:
-        date_choice = str(self.query_one("#date-choice", Select).value or "today")
-        sort_mode = str(self.query_one("#sort-mode", Select).value or "none")
-        count_mode = str(self.query_one("#count-mode", Select).value or "all")
-        has_lineups = bool(self.query_one("#has-lineups", Checkbox).value)
+        if self._preview_header is None:
+            self._preview_header = self._build_preview_header()
+        lines = [self._preview_header, f"Matches selected: {len(chosen_matches)}"]
+        lines.extend([f"- {match.get('_label') or self._match_label(match)}" for match in chosen_matches])
+        return "\n".join(lines)
+
+    def _build_preview_header(self) -> str:
+        date_choice = str(self._date_choice.value or "today")
+        sort_mode = str(self._sort_mode.value or "none")
+        count_mode = str(self._count_mode.value or "all")
+        has_lineups = bool(self._has_lineups.value)
         min_average = self._parse_min_average()
         stats = ", ".join(self._selected_stat_keys()) or "(none)"
         output_path, output_both = self._output_settings()
@@ -432,14 +638,12 @@ class StatsHubTUI(App):
             f"Date: {date_choice}",
             f"Sort: {sort_mode}",
             f"Count mode: {count_mode}",
-            f"Headless: {bool(self.query_one('#headless', Checkbox).value)}",
+            f"Headless: {bool(self._headless_checkbox.value)}",
             f"Confirmed lineups: {has_lineups}",
             f"Min average: {min_average}",
             f"Stats: {stats}",
             f"Output: {output_label}",
-            f"Matches selected: {len(chosen_matches)}",
         ]
-        lines.extend([f"- {self._match_label(match)}" for match in chosen_matches])
         return "\n".join(lines)
 
     def _refresh_preview_if_possible(self) -> None:
@@ -450,24 +654,31 @@ class StatsHubTUI(App):
             return
         self._set_summary(self._build_preview_text(chosen_matches))
 
+    def _schedule_preview_refresh(self) -> None:
+        """Refresh the preview once typing or toggling pauses for 120 ms."""
+        self._preview_header = None
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        self._preview_timer = self.set_timer(0.12, self._refresh_preview_if_possible)
+
+    def _apply_change_effects(self, widget_id: str | None) -> None:
+        for effect in self._CHANGE_EFFECTS.get(widget_id or "", ()):
+            getattr(self, effect)()
+
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
-        if event.checkbox.id == "has-lineups":
-            self._sync_lineup_flow()
-            self._refresh_preview_if_possible()
-            return
         if event.checkbox.id == "headless":
             self.default_headless = bool(event.value)
-            self._refresh_preview_if_possible()
+        self._apply_change_effects(event.checkbox.id)
 
     def on_select_changed(self, event: Select.Changed) -> None:
-        if event.select.id in {"count-mode", "output-choice"}:
-            self._sync_mode_inputs()
-        if event.select.id in {"date-choice", "output-choice", "sort-mode", "count-mode"}:
-            self._refresh_preview_if_possible()
+        self._apply_change_effects(event.select.id)
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        if event.input.id in {"min-average", "output-path", "count-n", "home-lineup", "away-lineup"}:
-            self._refresh_preview_if_possible()
+        if event.input.id == "min-average":
+            old_min = self._min_average_cached
+            self._min_average_cached = self._min_average_from(event.value)
+            self._recolor_averages(old_min, self._min_average_cached)
+        self._apply_change_effects(event.input.id)
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         button_id = event.button.id
@@ -481,14 +692,15 @@ class StatsHubTUI(App):
             button_id = "run"
 
         if button_id == "discover-matches":
-            date_choice = str(self.query_one("#date-choice", Select).value or "today")
-            self.default_headless = bool(self.query_one("#headless", Checkbox).value)
+            date_choice = str(self._date_choice.value or "today")
+            self.default_headless = bool(self._headless_checkbox.value)
             self._log(f"Discovering matches for {date_choice}...")
             try:
-                matches = await asyncio.to_thread(discover_matches, date_choice, self.default_headless)
+                matches = await self._discover(date_choice)
             except Exception as exc:
                 self._log(f"ERROR discovering matches: {exc}")
                 return
+            self._index_matches(matches)
             self._discovered_matches = matches
             self._visible_matches = list(matches)
             if not matches:
@@ -548,66 +760,124 @@ class StatsHubTUI(App):
             self._log("ERROR: Select at least one stat.")
             return
 
-        has_lineups = bool(self.query_one("#has-lineups", Checkbox).value)
+        has_lineups = bool(self._has_lineups.value)
         home_positions = None
         away_positions = None
         if has_lineups:
-            home_lineup = self.query_one("#home-lineup", Input).value.strip()
-            away_lineup = self.query_one("#away-lineup", Input).value.strip()
+            home_lineup = self._home_lineup.value.strip()
+            away_lineup = self._away_lineup.value.strip()
             home_positions = get_lineup_positions(home_lineup)
             away_positions = get_lineup_positions(away_lineup)
             if not home_positions or not away_positions:
-                lineup_list = ", ".join(sorted(LINEUP_POSITIONS.keys()))
-                self._log("ERROR: Unknown lineup. Supported: " + lineup_list)
+                self._log(_LINEUP_ERROR)
                 return
 
         min_average = self._parse_min_average()
         base_output, output_both = self._output_settings()
 
-        run_button = self.query_one("#run", Button)
-        run_button.disabled = True
+        self.running = True
         self._log(f"Starting collection for {len(chosen_matches)} match(es)...")
         self._set_flow_state("results")
 
+        self.run_worker(
+            self._collect_matches(
+                chosen_matches,
+                stat_keys,
+                min_average,
+                has_lineups,
+                home_positions,
+                away_positions,
+                base_output,
+                output_both,
+            ),
+            exclusive=True,
+            group="collect",
+        )
+
+    async def _collect_matches(
+        self,
+        chosen_matches: list[dict],
+        stat_keys: list[str],
+        min_average: float,
+        has_lineups: bool,
+        home_positions: tuple[str, ...] | None,
+        away_positions: tuple[str, ...] | None,
+        base_output: str | None,
+        output_both: bool,
+    ) -> None:
+        """Collect the chosen matches in parallel; a newer run cancels this one.
+
+        Matches are scraped on the app's worker pool, which bounds how many
+        browsers run at once. A failed match is logged and the rest carry on;
+        the results pane shows the last match in selection order that has
+        finished so far, whatever order they complete in.
+        """
+        total = len(chosen_matches)
+
+        async def _collect_one(index: int, match: dict, match_url: str) -> tuple[int, dict, str | None, dict]:
+            per_match_output = self._output_path_for_match(base_output, match, total)
+            result = await self._run_blocking(
+                collect_data,
+                match_url,
+                stat_keys,
+                min_average,
+                has_lineups,
+                home_positions,
+                away_positions,
+                self.default_headless,
+                per_match_output,
+                output_both,
+            )
+            return index, match, per_match_output, result
+
+        tasks = []
+        for index, match in enumerate(chosen_matches, start=1):
+            match_url = str(match.get("match_url") or "")
+            if not match_url:
+                self._log("ERROR: One selected match has no URL; skipping.")
+                continue
+            self._log(f"[{index}/{total}] {self._match_label(match)}")
+            tasks.append(asyncio.ensure_future(_collect_one(index, match, match_url)))
+
+        shown_index = 0
         try:
-            for index, match in enumerate(chosen_matches, start=1):
-                match_url = str(match.get("match_url") or "")
-                if not match_url:
-                    self._log("ERROR: One selected match has no URL; skipping.")
+            for finished in asyncio.as_completed(tasks):
+                try:
+                    index, match, per_match_output, result = await finished
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    self._log(f"ERROR: {exc}")
                     continue
-                self._log(f"[{index}/{len(chosen_matches)}] {self._match_label(match)}")
-                per_match_output = self._output_path_for_match(base_output, match, len(chosen_matches))
-                result = await asyncio.to_thread(
-                    collect_data,
-                    match_url,
-                    stat_keys,
-                    min_average,
-                    has_lineups,
-                    home_positions,
-                    away_positions,
-                    self.default_headless,
-                    per_match_output,
-                    output_both,
-                )
-                self._last_data = result
-                self._build_tabs_from_selection()
-                self._set_right_mode("results")
+                if index > shown_index:
+                    shown_index = index
+                    self._set_last_data(result)
+                    self._render_selected_stat()
+                    self._set_right_mode("results")
+                self._log(f"[{index}/{total}] Done: {self._match_label(match)}")
                 if per_match_output:
                     self._log(f"Saved: {per_match_output}")
             self._log("Collection completed.")
+        except asyncio.CancelledError:
+            raise  # superseded by a newer run, which now owns the running flag
         except Exception as exc:
             self._log(f"ERROR: {exc}")
         finally:
-            run_button.disabled = False
+            for task in tasks:
+                task.cancel()
+        self.running = False
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         if event.option_list.id != "stat-tabs":
             return
-        self._current_stat = str(event.option.prompt)
+        if event.option.id == self._current_stat:
+            return
+        self._current_stat = event.option.id
         self._render_selected_stat()
 
     def on_selection_list_selected_changed(self, event: SelectionList.SelectedChanged) -> None:
         if event.selection_list.id == "stats-list":
+            self._preview_header = None
             self._build_tabs_from_selection()
             self._refresh_preview_if_possible()
             return
@@ -616,17 +886,18 @@ class StatsHubTUI(App):
         if self._flow_state == "config":
             return
         selected_count = len(event.selection_list.selected)
-        count_mode_widget = self.query_one("#count-mode", Select)
+        count_mode_widget = self._count_mode
         target_mode = "all"
         if selected_count == 1:
             target_mode = "one"
         elif selected_count > 1:
             target_mode = "n"
-            self.query_one("#count-n", Input).value = str(selected_count)
+            self._count_n_input.value = str(selected_count)
 
         current_mode = str(count_mode_widget.value or "all")
         if current_mode != target_mode:
             count_mode_widget.value = target_mode
+            self._preview_header = None
 
         chosen_matches, error = self._selected_matches_for_run()
         if error:
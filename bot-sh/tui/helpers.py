@@ -2,18 +2,40 @@
 
 from __future__ import annotations
 
+import functools
+
 from bot_sh.models import CLI_STAT_MAPPING, STAT_DISPLAY_NAMES
 
 
-def to_float(value: object) -> float:
+@functools.lru_cache(maxsize=4096)
+def _to_float_cached(value: str | int | float) -> float:
     try:
-        if value is None or value == "":
+        if value == "":
             return 0.0
         return float(value)
-    except Exception:
+    except (OverflowError, ValueError):
+        return 0.0
+
+
+def to_float(value: object) -> float:
+    if type(value) is float:
+        return value
+    # Scraped cells repeat the same few strings ("0", "1.00"), so memoize scalars.
+    if isinstance(value, (str, int, float)):
+        return _to_float_cached(value)
+    if value is None:
+        return 0.0
+    try:
+        return float(value)  # Decimal and other float-convertible types
+    except (TypeError, ValueError, OverflowError):
         return 0.0
 
 
+def format_number(value: float) -> str:
+    return str(int(value)) if value.is_integer() else f"{value:.2f}"
+
+
+@functools.cache
 def display_name_for_cli_key(cli_key: str) -> str:
     internal = CLI_STAT_MAPPING.get(cli_key, cli_key)
     return STAT_DISPLAY_NAMES.get(internal, cli_key)
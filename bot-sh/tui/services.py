@@ -2,52 +2,95 @@
 
 from __future__ import annotations
 
-import json
 import re
-import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 
-from bot_sh import cli
+from bot_sh import cli, scraper
+from bot_sh.browser import BrowserSession
 from bot_sh.models import CLI_STAT_MAPPING
-from bot_sh.outputs import derive_alt_output_path
-from playwright.sync_api import sync_playwright
+from bot_sh.outputs import derive_alt_output_path, dumps_json, write_csv
+
+_FIXTURE_RE = re.compile(r"/fixture/([^/]+)/(\d+)")
+_KICKOFF_RE = re.compile(r"\b(\d{1,2}:\d{2})\b")
 
 
 def _save_results_silent(data: dict, output_path: str) -> None:
     out_path = Path(output_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     if out_path.suffix.lower() == ".csv":
-        import csv
-
-        with out_path.open("w", newline="", encoding="utf-8") as file_obj:
-            writer = csv.writer(file_obj)
-            writer.writerow(["team", "stat", "position", "total", "average", "highest", "no_data"])
-            for team, stats_dict in data.items():
-                for stat_name, positions in stats_dict.items():
-                    for pos in positions:
-                        writer.writerow(
-                            [
-                                team,
-                                stat_name,
-                                pos.get("position", ""),
-                                pos.get("total", ""),
-                                pos.get("average", ""),
-                                pos.get("highest", ""),
-                                bool(pos.get("no_data", False)),
-                            ]
-                        )
+        write_csv(data, output_path)
         return
-    with out_path.open("w", encoding="utf-8") as file_obj:
-        json.dump(data, file_obj, ensure_ascii=False, indent=2)
+    out_path.write_bytes(dumps_json(data))
+
+
+# Per-thread {headless: open BrowserSession}; see _thread_session.
+_THREAD_STATE = threading.local()
+
+
+@contextmanager
+def _thread_session(headless: bool):
+    """Yield this thread's browser for ``headless``, launching it on first use.
+
+    Sync Playwright objects are bound to the thread that created them, so
+    each TUI worker thread keeps its own browser alive between calls and
+    every call still gets a fresh context. A session that raised is closed
+    and relaunched next time, in case the browser itself died.
+    """
+    sessions = getattr(_THREAD_STATE, "sessions", None)
+    if sessions is None:
+        sessions = _THREAD_STATE.sessions = {}
+    session = sessions.get(headless)
+    if session is None:
+        session = sessions[headless] = BrowserSession(headless=headless).__enter__()
+    try:
+        yield session
+    except BaseException:
+        sessions.pop(headless, None)
+        session.close()
+        raise
+
+
+def close_thread_sessions() -> None:
+    """Close the browsers opened by ``_thread_session`` on the calling thread."""
+    sessions = getattr(_THREAD_STATE, "sessions", None) or {}
+    while sessions:
+        _, session = sessions.popitem()
+        session.close()
+
+
+# (date_filter, headless) -> (monotonic time stored, matches)
+_DISCOVER_CACHE: dict[tuple[str, bool], tuple[float, list[dict]]] = {}
+_DISCOVER_TTL_S = 60.0
 
 
 def discover_matches(date_filter: str, headless: bool) -> list[dict]:
+    """Return fixtures for ``date_filter``, reusing a result under a minute old.
+
+    Callers get fresh dict copies, so annotating the matches never touches
+    the cached list.
+    """
+    key = (date_filter, headless)
+    cached = _DISCOVER_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _DISCOVER_TTL_S:
+        return [dict(match) for match in cached[1]]
+    matches = _discover_matches_uncached(date_filter, headless)
+    if matches:
+        _DISCOVER_CACHE[key] = (time.monotonic(), [dict(match) for match in matches])
+    return matches
+
+
+def _discover_matches_uncached(date_filter: str, headless: bool) -> list[dict]:
     def _settle() -> None:
+        # networkidle can hang on long-polling requests; wait for the DOM to
+        # go quiet and for the fixture links we actually read.
+        scraper.wait_for_page_settled(page, timeout_ms=3000)
         try:
-            page.wait_for_load_state("networkidle", timeout=8000)
+            page.locator('a[href*="/fixture/"]').first.wait_for(state="attached", timeout=8000)
         except Exception:
-            page.wait_for_load_state("domcontentloaded", timeout=8000)
-            page.wait_for_timeout(1200)
+            pass
 
     def _click_date(label: str) -> None:
         click_errors: list[str] = []
@@ -66,93 +109,67 @@ def discover_matches(date_filter: str, headless: bool) -> list[dict]:
 
     def _extract() -> list[dict]:
         found: list[dict] = []
-        links = page.locator('a[href*="/fixture/"]').all()
-        seen = set()
+        # One round-trip for every link's href and text, deduplicated in the page
+        links = page.locator('a[href*="/fixture/"]').evaluate_all(scraper.FIXTURE_LINKS_JS)
         for link in links:
-            try:
-                href = link.get_attribute("href")
-                if not href or href in seen:
-                    continue
-                seen.add(href)
-                match = re.search(r"/fixture/([^/]+)/(\d+)", href)
-                if not match:
-                    continue
-                slug = match.group(1)
-                parts = slug.split("-vs-")
-                if len(parts) != 2:
-                    continue
-                home_slug, away_slug = parts
-                home = " ".join(w.capitalize() for w in home_slug.split("-"))
-                away = " ".join(w.capitalize() for w in away_slug.split("-"))
-                try:
-                    text = link.inner_text() or ""
-                except Exception:
-                    text = ""
-                time_match = re.search(r"\b(\d{1,2}:\d{2})\b", text)
-                kickoff = time_match.group(1) if time_match else ""
-                found.append(
-                    {
-                        "match_url": href,
-                        "home_name": home,
-                        "away_name": away,
-                        "kickoff_time": kickoff,
-                    }
-                )
-            except Exception:
+            href = link["href"]
+            match = _FIXTURE_RE.search(href)
+            if not match:
+                continue
+            slug = match.group(1)
+            parts = slug.split("-vs-")
+            if len(parts) != 2:
                 continue
+            home_slug, away_slug = parts
+            home = home_slug.replace("-", " ").title()
+            away = away_slug.replace("-", " ").title()
+            time_match = _KICKOFF_RE.search(link.get("text") or "")
+            kickoff = time_match.group(1) if time_match else ""
+            found.append(
+                {
+                    "match_url": href,
+                    "home_name": home,
+                    "away_name": away,
+                    "kickoff_time": kickoff,
+                }
+            )
         return found
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=headless)
-        context = browser.new_context()
-        page = context.new_page()
-        try:
-            page.goto("https://www.statshub.com/")
+    with _thread_session(headless) as session, session.page() as page:
+        page.goto("https://www.statshub.com/", wait_until="domcontentloaded")
+
+        label = date_filter.capitalize()
+        # StatsHub occasionally ignores the first filter click: re-click on the
+        # same page first, and only reload if that still shows no fixtures.
+        for attempt in range(3):
+            if attempt == 2:
+                page.reload(wait_until="domcontentloaded")
+                scraper.wait_for_page_settled(page, timeout_ms=3000)
+            _click_date(label)
             _settle()
-
-            label = date_filter.capitalize()
-            # Retry once because StatsHub occasionally ignores the first filter click.
-            for attempt in range(2):
-                _click_date(label)
-                _settle()
-                matches = _extract()
-                if matches:
-                    return matches
-                if attempt == 0:
-                    page.reload(wait_until="domcontentloaded")
-                    _settle()
-        finally:
-            context.close()
-            browser.close()
+            matches = _extract()
+            if matches:
+                return matches
 
     return []
 
 
+def _extract_tabs_on_page(page, match_url: str) -> tuple[str, str]:
+    full_url = match_url if match_url.startswith("http") else "https://www.statshub.com" + match_url
+    page.goto(full_url)
+    # click() waits for the button; then wait for the tabs we read next.
+    scraper.open_opponent_stats(page)
+    scraper.wait_for_team_tabs(page, timeout_ms=15000)
+    # One round-trip for every tab's text instead of one inner_text() per tab
+    tabs = [t for t in map(str.strip, page.locator('[role="tab"]').all_inner_texts()) if t]
+    if len(tabs) < 2:
+        raise RuntimeError("Could not detect team tabs for selected match.")
+    return tabs[0], tabs[1]
+
+
 def extract_tabs(match_url: str, headless: bool) -> tuple[str, str]:
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=headless)
-        context = browser.new_context()
-        page = context.new_page()
-        try:
-            full_url = match_url if match_url.startswith("http") else "https://www.statshub.com" + match_url
-            page.goto(full_url)
-            try:
-                page.wait_for_load_state("networkidle", timeout=15000)
-            except Exception:
-                page.wait_for_timeout(1200)
-            page.get_by_role("button", name="Opponent Stats NEW!").click()
-            try:
-                page.wait_for_load_state("networkidle", timeout=15000)
-            except Exception:
-                page.wait_for_timeout(1200)
-            tabs = [t.inner_text().strip() for t in page.locator('[role="tab"]').all()]
-            tabs = [t for t in tabs if t]
-            if len(tabs) < 2:
-                raise RuntimeError("Could not detect team tabs for selected match.")
-            return tabs[0], tabs[1]
-        finally:
-            context.close()
-            browser.close()
+    with _thread_session(headless) as session, session.page() as page:
+        return _extract_tabs_on_page(page, match_url)
 
 
 def collect_data(
@@ -160,20 +177,23 @@ def collect_data(
     stat_keys: list[str],
     min_average: float,
     has_lineups: bool,
-    home_positions: list[str] | None,
-    away_positions: list[str] | None,
+    home_positions: tuple[str, ...] | None,
+    away_positions: tuple[str, ...] | None,
     headless: bool,
     output_path: str | None = None,
     output_both: bool = False,
+    session: BrowserSession | None = None,
 ) -> dict:
-    requested_output = output_path
-    with tempfile.NamedTemporaryFile("w+", suffix=".json", delete=False) as tmp_file:
-        temp_output_path = tmp_file.name
-
-    try:
-        home_tab, away_tab = extract_tabs(match_url, headless=headless)
-        internal_stats = [CLI_STAT_MAPPING[s] for s in stat_keys if s in CLI_STAT_MAPPING]
-        cli.run_single_by_url(
+    """Scrape one match; tab detection and scraping share one browser."""
+    owner = nullcontext(session) if session is not None else _thread_session(headless)
+    with owner as session:
+        with session.page() as page:
+            home_tab, away_tab = _extract_tabs_on_page(page, match_url)
+            session.remember_storage_state(page)
+        internal_stats = [
+            internal for s in stat_keys if (internal := CLI_STAT_MAPPING.get(s)) is not None
+        ]
+        data = cli.run_single_by_url(
             match_url=match_url,
             home_team_tab=home_tab,
             away_team_tab=away_tab,
@@ -181,21 +201,17 @@ def collect_data(
             debug=False,
             stats=internal_stats,
             headless=headless,
-            output=temp_output_path,
+            output=None,
             output_both=False,
             home_lineup_positions=home_positions if has_lineups else None,
             away_lineup_positions=away_positions if has_lineups else None,
             verbose=False,
+            session=session,
         )
-        with open(temp_output_path, "r", encoding="utf-8") as file_obj:
-            data = json.load(file_obj)
-        if requested_output:
-            _save_results_silent(data, requested_output)
-            if output_both:
-                _save_results_silent(data, derive_alt_output_path(requested_output))
-        return data
-    finally:
-        try:
-            Path(temp_output_path).unlink(missing_ok=True)
-        except Exception:
-            pass
+    if not data:
+        raise RuntimeError("No data collected for selected match.")
+    if output_path:
+        _save_results_silent(data, output_path)
+        if output_both:
+            _save_results_silent(data, derive_alt_output_path(output_path))
+    return data